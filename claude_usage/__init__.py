@@ -24,15 +24,11 @@ UsageAnalytics = CodeAnalytics
 class ClaudeUsageMonitor:
     """Backward compatibility wrapper - delegates to CodeMonitor or ConsoleMonitor"""
 
-    def __init__(self, credentials_path=None):
+    def __init__(self, credentials_path=None, credentials_provider=None):
         if credentials_path is None:
             credentials_path = Path.home() / ".claude" / ".credentials.json"
 
-        self.credentials_path = Path(credentials_path)
-
-        # Detect mode
-        self._detected_mode, error = detect_mode(self.credentials_path)
-        self.error_message = error if not self._detected_mode else None
+        self._reinit(credentials_path, credentials_provider)
 
         # Use detected mode or default to code for monitor creation
         self.mode = self._detected_mode if self._detected_mode else "code"
@@ -43,6 +39,20 @@ class ClaudeUsageMonitor:
         else:
             self._monitor = CodeMonitor(credentials_path)
 
+    def _reinit(self, credentials_path, credentials_provider=None):
+        """Re-run mode detection for new credentials
+
+        Only the detection state is reset; the underlying monitor and
+        self.mode are left as they are (see resolve_mode to switch them).
+        """
+        self.credentials_path = Path(credentials_path)
+
+        # Detect mode; credentials_provider replaces reading the credentials file
+        self._detected_mode, error = detect_mode(
+            self.credentials_path, credentials_provider
+        )
+        self.error_message = error if not self._detected_mode else None
+
     def __getattr__(self, name):
         """Delegate all attribute access to underlying monitor"""
         return getattr(self._monitor, name)
@@ -4,6 +4,7 @@ import re
 import textwrap
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from rich.progress import BarColumn, Progress, TextColumn
 from rich.table import Table
 from rich.text import Text
@@ -1634,12 +1635,14 @@ def render_activity_line(events: list) -> "Text":
     return text
 
 
-def _get_all_known_codes() -> set:
-    """Return the set of all known 2-letter event codes."""
-    codes: set[str] = set()
-    for group in _ACTIVITY_GROUPS:
-        codes.update(group)
-    return codes
+@lru_cache(maxsize=1)
+def _get_all_known_codes() -> frozenset:
+    """Return the set of all known 2-letter event codes.
+
+    _ACTIVITY_GROUPS is constant, so the set is built once and shared
+    (frozen, so callers cannot mutate the cached value).
+    """
+    return frozenset(code for group in _ACTIVITY_GROUPS for code in group)
 
 
 def render_collapsed_plan_tier_line(plan_badges: list, rate_tier: str) -> "Text":
@@ -495,5 +495,8 @@ class CodeMonitor:
 
         except KeyboardInterrupt:
             return 0
+        finally:
+            # Release the pace-maker metrics connection
+            self.pacemaker_reader.close()
 
         return 0
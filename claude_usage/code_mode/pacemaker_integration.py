@@ -6,7 +6,10 @@ in the usage monitor without requiring pace-maker to be installed.
 
 import json
 import logging
+import os
 import sqlite3
+import threading
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
@@ -27,6 +30,13 @@ DEFAULT_LOG_LEVEL = 2
 # SQLite connection timeout in seconds (used for all direct DB reads)
 DB_TIMEOUT = 5.0
 
+# config.json modified more recently than this is always re-read: a same-size
+# rewrite within one coarse mtime tick would otherwise look unchanged
+CONFIG_SETTLE_NS = 1_000_000_000
+
+# Page cache for the persistent metrics connection (negative = KiB, ~20 MB)
+METRICS_CACHE_SIZE_KIB = -20000
+
 # Codex usage table singleton row id (pace-maker stores exactly one record)
 CODEX_USAGE_ROW_ID = 1
 
@@ -151,6 +161,16 @@ def _find_pipx_site_packages(install_path: str) -> Optional[str]:
 class PaceMakerReader:
     """Reads pace-maker state from database and config files"""
 
+    # 24h Langfuse totals. Kept as one string so the persistent metrics
+    # connection's statement cache reuses the compiled query on every poll.
+    _LANGFUSE_SUM_SQL = """
+        SELECT COALESCE(SUM(sessions_count), 0),
+               COALESCE(SUM(traces_count), 0),
+               COALESCE(SUM(spans_count), 0)
+        FROM langfuse_metrics
+        WHERE bucket_timestamp >= ?
+    """
+
     def __init__(self):
         """Initialize pace-maker reader with default paths"""
         self.pm_dir = Path.home() / ".claude-pace-maker"
@@ -161,6 +181,76 @@ class PaceMakerReader:
         self._blockage_stats_cache = None
         self._blockage_stats_cache_time = 0
         self._cache_ttl_seconds = 5
+        # Parsed config.json, reused while its stat identity is unchanged
+        self._config_cache = None
+        self._config_stat = None
+        # Read-only connection reused by the 24h metrics readers, keyed by the
+        # database file identity so a replaced usage.db is reopened. The lock
+        # serialises its single cursor; the monitors close it on shutdown
+        self._metrics_conn = None
+        self._metrics_conn_key = None
+        self._metrics_cursor = None
+        self._metrics_lock = threading.RLock()
+
+    @property
+    def db_path(self):
+        """Path to pace-maker's usage.db"""
+        return self._db_path
+
+    @db_path.setter
+    def db_path(self, value):
+        # Derive the string and read-only URI forms once per assignment
+        # rather than on every sqlite3.connect() in the refresh loop
+        self._db_path = value
+        self._db_path_str = str(value)
+        self._db_uri = f"{Path(os.path.abspath(self._db_path_str)).as_uri()}?mode=ro"
+
+    def close(self):
+        """Close the persistent metrics connection, if one is open"""
+        with self._metrics_lock:
+            if self._metrics_conn is not None:
+                self._metrics_conn.close()
+                self._metrics_conn = None
+                self._metrics_conn_key = None
+                self._metrics_cursor = None
+
+    def _get_metrics_cursor(self, db_stat) -> sqlite3.Cursor:
+        """Return the cursor of the read-only metrics connection.
+
+        Opens the connection (and its single reused cursor) with mode=ro on
+        first use, and reopens it whenever db_path or the file behind it
+        changes. Callers must hold self._metrics_lock until they are done
+        with the cursor.
+
+        Args:
+            db_stat: os.stat_result for self.db_path
+
+        Returns:
+            Cursor on an open sqlite3 connection to the pace-maker database
+        """
+        key = (self._db_path_str, db_stat.st_dev, db_stat.st_ino)
+        if self._metrics_conn is not None and key == self._metrics_conn_key:
+            return self._metrics_cursor
+
+        self.close()
+        conn = sqlite3.connect(
+            self._db_uri,
+            uri=True,
+            timeout=DB_TIMEOUT,
+            check_same_thread=False,
+        )
+        try:
+            # No-op on pace-maker's WAL database; a read-only connection
+            # cannot switch a rollback-journal database, which reads fine
+            conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.OperationalError:
+            pass
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(f"PRAGMA cache_size={METRICS_CACHE_SIZE_KIB}")
+        self._metrics_conn = conn
+        self._metrics_conn_key = key
+        self._metrics_cursor = conn.cursor()
+        return self._metrics_cursor
 
     def _get_pacemaker_src_path(self) -> Optional[Path]:
         """Find pace-maker source directory path.
@@ -413,7 +503,7 @@ class PaceMakerReader:
                 coeff_7d_5x = _DEFAULT_TOKEN_COSTS["5x"]["coefficient_7d"]
                 coeff_7d_20x = _DEFAULT_TOKEN_COSTS["20x"]["coefficient_7d"]
 
-                model = UsageModel(db_path=str(self.db_path))
+                model = UsageModel(db_path=self._db_path_str)
                 cal_5x = model._get_calibrated_coefficients("5x")
                 if cal_5x is not None:
                     coeff_5h_5x, coeff_7d_5x = cal_5x
@@ -490,7 +580,7 @@ class PaceMakerReader:
         if not self.db_path.exists():
             return None
         try:
-            with sqlite3.connect(str(self.db_path), timeout=DB_TIMEOUT) as conn:
+            with sqlite3.connect(self._db_path_str, timeout=DB_TIMEOUT) as conn:
                 conn.execute("PRAGMA journal_mode=WAL")
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
@@ -513,16 +603,45 @@ class PaceMakerReader:
             return None
 
     def _read_config(self) -> Optional[Dict[str, Any]]:
-        """Read pace-maker configuration file"""
+        """Read pace-maker configuration file
+
+        The parsed config is cached and only re-read when the file's path,
+        inode, mtime, ctime or size changes, so repeated status checks within
+        a monitor tick cost one stat() instead of a JSON parse. A file whose
+        mtime is under CONFIG_SETTLE_NS old is always re-read, since it may
+        be rewritten again without any of those changing.
+        """
         try:
-            if not self.config_path.exists():
-                return None
+            st = self.config_path.stat()
+        except OSError:
+            # Missing config - nothing to cache
+            self._config_cache = None
+            self._config_stat = None
+            return None
 
+        config_stat = (
+            str(self.config_path),
+            st.st_ino,
+            st.st_mtime_ns,
+            st.st_ctime_ns,
+            st.st_size,
+        )
+        if (
+            config_stat == self._config_stat
+            and time.time_ns() - st.st_mtime_ns >= CONFIG_SETTLE_NS
+        ):
+            return self._config_cache
+
+        try:
             with open(self.config_path) as f:
-                return json.load(f)
+                config = json.load(f)
         except (json.JSONDecodeError, OSError):
             return None
 
+        self._config_cache = config
+        self._config_stat = config_stat
+        return config
+
     def _get_latest_usage(self) -> Optional[Dict[str, Any]]:
         """Get latest usage snapshot via UsageModel (single source of truth).
 
@@ -543,7 +662,7 @@ class PaceMakerReader:
 
             from pacemaker.usage_model import UsageModel
 
-            model = UsageModel(db_path=str(self.db_path))
+            model = UsageModel(db_path=self._db_path_str)
             snapshot = model.get_current_usage()
             if snapshot is None:
                 return None
@@ -595,7 +714,7 @@ class PaceMakerReader:
             # Calculate cutoff timestamp (60 minutes ago)
             cutoff_timestamp = int(time.time()) - 3600
 
-            conn = sqlite3.connect(str(self.db_path), timeout=5.0)
+            conn = sqlite3.connect(self._db_path_str, timeout=5.0)
             conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
 
@@ -701,49 +820,41 @@ class PaceMakerReader:
             - total: Sum of all three metrics
             Returns None if database is unavailable or table doesn't exist.
         """
-        if not self.db_path.exists():
+        try:
+            db_stat = self.db_path.stat()
+        except OSError:
             return None
 
         try:
             import time
 
-            cutoff = time.time() - SECONDS_IN_24_HOURS
+            # Whole seconds, matching the integer bucket_timestamp keys
+            cutoff = int(time.time()) - SECONDS_IN_24_HOURS
 
-            conn = sqlite3.connect(str(self.db_path), timeout=5.0)
-            conn.execute("PRAGMA journal_mode=WAL")
-            try:
-                cursor = conn.cursor()
+            # Persistent read-only connection: each tick is one query against
+            # a warm page cache instead of a fresh open
+            with self._metrics_lock:
+                cursor = self._get_metrics_cursor(db_stat)
 
                 # Query sum of all metrics within 24-hour window
-                cursor.execute(
-                    """
-                    SELECT COALESCE(SUM(sessions_count), 0),
-                           COALESCE(SUM(traces_count), 0),
-                           COALESCE(SUM(spans_count), 0)
-                    FROM langfuse_metrics
-                    WHERE bucket_timestamp >= ?
-                    """,
-                    (cutoff,),
-                )
+                cursor.execute(self._LANGFUSE_SUM_SQL, (cutoff,))
 
                 row = cursor.fetchone()
 
-                if not row:
-                    return None
+            if not row:
+                return None
 
-                sessions = int(row[0])
-                traces = int(row[1])
-                spans = int(row[2])
-                total = sessions + traces + spans
+            sessions = int(row[0])
+            traces = int(row[1])
+            spans = int(row[2])
+            total = sessions + traces + spans
 
-                return {
-                    "sessions": sessions,
-                    "traces": traces,
-                    "spans": spans,
-                    "total": total,
-                }
-            finally:
-                conn.close()
+            return {
+                "sessions": sessions,
+                "traces": traces,
+                "spans": spans,
+                "total": total,
+            }
 
         except (sqlite3.Error, OSError):
             # Graceful degradation - return None when database is unavailable
@@ -761,18 +872,20 @@ class PaceMakerReader:
             - secrets_masked: Total secrets masked in last 24h
             Returns None if database is unavailable or table doesn't exist.
         """
-        if not self.db_path.exists():
+        try:
+            db_stat = self.db_path.stat()
+        except OSError:
             return None
 
         try:
             import time
 
-            cutoff = time.time() - SECONDS_IN_24_HOURS
+            # Whole seconds, matching the integer bucket_timestamp keys
+            cutoff = int(time.time()) - SECONDS_IN_24_HOURS
 
-            conn = sqlite3.connect(str(self.db_path), timeout=5.0)
-            conn.execute("PRAGMA journal_mode=WAL")
-            try:
-                cursor = conn.cursor()
+            # Same read-only connection as get_langfuse_metrics
+            with self._metrics_lock:
+                cursor = self._get_metrics_cursor(db_stat)
 
                 # Query sum of all secrets masked within 24-hour window
                 cursor.execute(
@@ -794,14 +907,12 @@ class PaceMakerReader:
                 # Query count of stored secrets
                 cursor.execute("SELECT COUNT(*) FROM secrets")
                 stored_row = cursor.fetchone()
-                secrets_stored = int(stored_row[0]) if stored_row else 0
+            secrets_stored = int(stored_row[0]) if stored_row else 0
 
-                return {
-                    "secrets_masked": secrets_masked,
-                    "secrets_stored": secrets_stored,
-                }
-            finally:
-                conn.close()
+            return {
+                "secrets_masked": secrets_masked,
+                "secrets_stored": secrets_stored,
+            }
 
         except (sqlite3.Error, OSError):
             # Graceful degradation - return None when database is unavailable
@@ -1101,7 +1212,7 @@ class PaceMakerReader:
 
             cutoff = time.time() - window_seconds
 
-            conn = sqlite3.connect(str(self.db_path), timeout=5.0)
+            conn = sqlite3.connect(self._db_path_str, timeout=5.0)
             conn.execute("PRAGMA journal_mode=WAL")
             try:
                 cursor = conn.cursor()
@@ -1153,7 +1264,7 @@ class PaceMakerReader:
 
             cutoff = time.time() - window_seconds
 
-            conn = sqlite3.connect(str(self.db_path), timeout=5.0)
+            conn = sqlite3.connect(self._db_path_str, timeout=5.0)
             conn.execute("PRAGMA journal_mode=WAL")
             try:
                 cursor = conn.cursor()
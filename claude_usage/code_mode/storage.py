@@ -70,7 +70,7 @@ class CodeStorage(BaseStorage):
                 (timestamp, mtd_cost, workspace_json),
             )
 
-            # Clean old data (keep only last 24 hours)
+            # Clean old data (keep only HISTORY_RETENTION seconds)
             cutoff = timestamp - self.HISTORY_RETENTION
             cursor.execute(
                 "DELETE FROM console_usage_snapshots WHERE timestamp < ?", (cutoff,)
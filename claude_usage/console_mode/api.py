@@ -3,7 +3,32 @@
 import random
 import time
 import requests
-from datetime import date
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from types import MappingProxyType
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _build_session():
+    """Build a pooled session so paginated requests reuse keep-alive sockets
+
+    Only connection failures are retried at the adapter level; HTTP 429s keep
+    their jittered retry loop in _handle_pagination, and other statuses are
+    reported.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.5),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _build_session()
 
 
 class ConsoleAPIClient:
@@ -12,14 +37,19 @@ class ConsoleAPIClient:
     def __init__(self, admin_key):
         self.admin_key = admin_key
         self.base_url = "https://api.anthropic.com"
+        self._mtd_cache = None
+        # Headers depend only on admin_key; build once, share read-only
+        self._headers = MappingProxyType(
+            {
+                "x-api-key": admin_key,
+                "anthropic-version": "2023-06-01",
+                "Content-Type": "application/json",
+            }
+        )
 
     def _get_headers(self):
         """Return required headers for Console API requests"""
-        return {
-            "x-api-key": self.admin_key,
-            "anthropic-version": "2023-06-01",
-            "Content-Type": "application/json",
-        }
+        return self._headers
 
     def _calculate_mtd_range(self):
         """Calculate Month-to-Date date range
@@ -28,8 +58,14 @@ class ConsoleAPIClient:
             tuple: (starting_at, ending_at) in YYYY-MM-DD format
         """
         today = date.today()
-        starting_at = date(today.year, today.month, 1)
-        return starting_at.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")
+        # The range only changes at midnight; reuse it for the rest of the day
+        cached = self._mtd_cache
+        if cached is not None and cached[0] == today:
+            return cached[1]
+
+        mtd_range = (today.replace(day=1).isoformat(), today.isoformat())
+        self._mtd_cache = (today, mtd_range)
+        return mtd_range
 
     def fetch_organization(self):
         """Fetch organization data from Console API
@@ -41,7 +77,7 @@ class ConsoleAPIClient:
         headers = self._get_headers()
 
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = _SESSION.get(url, headers=headers, timeout=10)
 
             if response.status_code == 200:
                 return response.json(), None
@@ -60,6 +96,13 @@ class ConsoleAPIClient:
         next_page = None
         page_param_key = None  # Will be determined from first response
 
+        # Bind per-page lookups once; the session is resolved per call
+        get = _SESSION.get
+        sleep = time.sleep
+        uniform = random.uniform
+        Timeout = requests.exceptions.Timeout
+        RequestException = requests.exceptions.RequestException
+
         while has_more:
             current_params = params.copy()
             if next_page:
@@ -71,17 +114,17 @@ class ConsoleAPIClient:
             response = None
             for attempt in range(3):
                 try:
-                    response = requests.get(
+                    response = get(
                         url, params=current_params, headers=headers, timeout=(5, 10)
                     )
-                except requests.exceptions.Timeout:
+                except Timeout:
                     return None, "Request timed out"
-                except requests.exceptions.RequestException as e:
+                except RequestException as e:
                     return None, f"Network error: {e}"
 
                 if response.status_code == 429 and attempt < 2:
-                    delay = 4 * (2**attempt) + random.uniform(0, 2)
-                    time.sleep(delay)
+                    delay = 4 * (2**attempt) + uniform(0, 2)
+                    sleep(delay)
                     continue
                 break
 
@@ -128,8 +171,29 @@ class ConsoleAPIClient:
 
         return all_data, None
 
+    @staticmethod
+    def _period_label(item):
+        """Return the "Month YYYY" label for a cost item, or empty string"""
+        if not isinstance(item, dict):
+            return ""
+        starting_at = item.get("starting_at", "")
+        if not starting_at:
+            return ""
+        try:
+            # Handle both "YYYY-MM-DD" and "YYYY-MM-DDTHH:MM:SSZ" formats
+            if "T" in starting_at:
+                # ISO format with time: 2025-11-01T00:00:00Z
+                start_date = datetime.fromisoformat(starting_at.replace("Z", "+00:00"))
+            else:
+                # Simple date format: 2025-11-01
+                start_date = datetime.strptime(starting_at, "%Y-%m-%d")
+
+            return start_date.strftime("%B %Y")  # e.g., "November 2025"
+        except (ValueError, AttributeError):
+            return ""
+
     def aggregate_cost_data(self, cost_data):
-        """Aggregate cost report data from list of daily items into summary dict
+        """Aggregate cost report data from daily items into summary dict
 
         Args:
             cost_data: List of cost items from API, each with structure:
@@ -146,55 +210,35 @@ class ConsoleAPIClient:
         if not cost_data:
             return {"total_cost_usd": 0, "period_label": ""}
 
-        total_cost = 0.0
-        period_label = ""
-
-        # Extract period label from first item (all items should be same month for MTD)
-        if cost_data and isinstance(cost_data[0], dict):
-            starting_at = cost_data[0].get("starting_at", "")
-            if starting_at:
-                try:
-                    from datetime import datetime
-
-                    # Handle both "YYYY-MM-DD" and "YYYY-MM-DDTHH:MM:SSZ" formats
-                    if "T" in starting_at:
-                        # ISO format with time: 2025-11-01T00:00:00Z
-                        start_date = datetime.fromisoformat(
-                            starting_at.replace("Z", "+00:00")
-                        )
-                    else:
-                        # Simple date format: 2025-11-01
-                        start_date = datetime.strptime(starting_at, "%Y-%m-%d")
-
-                    period_label = start_date.strftime("%B %Y")  # e.g., "November 2025"
-                except (ValueError, AttributeError):
-                    period_label = ""
+        # Sum in Decimal so string amounts add up exactly; convert once at the end
+        total_cost = Decimal(0)
+        period_label = None
 
+        # Hot loop: bind Decimal locally and let try/except handle bad amounts
+        _decimal = Decimal
         for item in cost_data:
-            if not isinstance(item, dict):
-                continue
+            if period_label is None:
+                # Label from first item (all items should be same month for MTD)
+                period_label = self._period_label(item)
 
-            results = item.get("results", [])
-            if not results:
+            if not isinstance(item, dict):
                 continue
 
-            for result in results:
-                if not isinstance(result, dict):
-                    continue
-
+            for result in item.get("results") or ():
                 # Only process USD currency
-                if result.get("currency") != "USD":
+                if not isinstance(result, dict) or result.get("currency") != "USD":
                     continue
 
-                # Parse amount safely
                 try:
-                    amount_str = result.get("amount", "0")
-                    total_cost += float(amount_str)
-                except (ValueError, TypeError):
-                    # Skip invalid amounts
-                    continue
+                    total_cost += _decimal(result["amount"])
+                except (KeyError, ValueError, TypeError, InvalidOperation):
+                    # Skip missing or invalid amounts
+                    pass
 
-        return {"total_cost_usd": total_cost, "period_label": period_label}
+        return {
+            "total_cost_usd": float(total_cost),
+            "period_label": period_label or "",
+        }
 
     def fetch_cost_report(self, starting_at, ending_at):
         """Fetch cost report and return aggregated data
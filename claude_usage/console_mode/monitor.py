@@ -6,7 +6,7 @@ import logging
 import os
 import time
 from pathlib import Path
-from datetime import datetime, date
+from datetime import datetime
 from rich.live import Live
 from rich.console import Console, Group
 from rich.text import Text
@@ -197,11 +197,11 @@ class ConsoleMonitor:
                 rate = self.analytics.calculate_console_mtd_rate(current_cost)
 
                 if rate:
-                    # Calculate hours until end of month
-                    today = date.today()
-                    last_day = calendar.monthrange(today.year, today.month)[1]
-                    eom = datetime(today.year, today.month, last_day, 23, 59, 59)
-                    hours_until_eom = (eom - datetime.now()).total_seconds() / 3600
+                    # Calculate hours until end of month from a single clock read
+                    now = datetime.now()
+                    last_day = calendar.monthrange(now.year, now.month)[1]
+                    eom = datetime(now.year, now.month, last_day, 23, 59, 59)
+                    hours_until_eom = (eom - now).total_seconds() / 3600
 
                     # Project to end of month
                     projected_cost = self.analytics.project_console_eom_cost(
@@ -299,5 +299,8 @@ class ConsoleMonitor:
 
         except KeyboardInterrupt:
             return 0
+        finally:
+            # Release the pace-maker metrics connection
+            self.pacemaker_reader.close()
 
         return 0
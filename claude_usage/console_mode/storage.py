@@ -36,8 +36,8 @@ class ConsoleStorage(BaseStorage):
         mtd_cost = mtd_data.get("total_cost_usd", 0)
         workspace_json = json.dumps(workspaces)
 
-        conn = self.get_connection()
-        try:
+        # Insert and retention cleanup commit together in one transaction
+        with self.get_connection() as conn:
             cursor = conn.cursor()
 
             cursor.execute(
@@ -49,16 +49,12 @@ class ConsoleStorage(BaseStorage):
                 (timestamp, mtd_cost, workspace_json),
             )
 
-            # Clean old data (keep only last 24 hours)
+            # Clean old data (keep only HISTORY_RETENTION seconds)
             cutoff = timestamp - self.HISTORY_RETENTION
             cursor.execute(
                 "DELETE FROM console_usage_snapshots WHERE timestamp < ?", (cutoff,)
             )
 
-            conn.commit()
-        finally:
-            conn.close()
-
         return True
 
 
@@ -79,8 +75,7 @@ class ConsoleAnalytics:
             # Try windows progressively: 30min, 1hr, 3hr, 6hr, 24hr, 7 days
             windows = [1800, 3600, 10800, 21600, 86400, 604800]
 
-            conn = self.storage.get_connection()
-            try:
+            with self.storage.get_connection(readonly=True) as conn:
                 cursor = conn.cursor()
 
                 for window in windows:
@@ -114,9 +109,6 @@ class ConsoleAnalytics:
                         rate = (cost_diff / time_diff) * 3600
                         return rate
 
-            finally:
-                conn.close()
-
             # No historical data found in any window
             return None
 
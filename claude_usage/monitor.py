@@ -24,7 +24,7 @@ def __getattr__(name):
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
-def detect_mode(credentials_path):
+def detect_mode(credentials_path, credentials_provider=None):
     """Detect which mode to run in: 'console' or 'code'
 
     Priority order:
@@ -32,13 +32,19 @@ def detect_mode(credentials_path):
     2. Claude Code OAuth credentials (subscription/code mode)
     3. Anthropic Console Admin API key (console mode)
     4. macOS Keychain (if on macOS and file doesn't exist)
+
+    credentials_provider, when given, is called instead of reading
+    credentials_path and must return the parsed credentials dict.
     """
     import os
 
     # Check credentials file
     try:
-        with open(credentials_path) as f:
-            data = json.load(f)
+        if credentials_provider is not None:
+            data = credentials_provider()
+        else:
+            with open(credentials_path) as f:
+                data = json.load(f)
 
         # Check for explicit mode field override (highest priority)
         if "mode" in data and data["mode"] in ["console", "code"]:
@@ -8,7 +8,7 @@ from pathlib import Path
 class BaseStorage:
     """Base class for SQLite database management"""
 
-    HISTORY_RETENTION = 604800  # Keep 7 days of history
+    HISTORY_RETENTION = 7 * 24 * 3600  # Keep 7 days of history (604800s)
 
     # Concurrency constants
     DB_TIMEOUT = 5.0
@@ -16,9 +16,14 @@ class BaseStorage:
     RETRY_DELAY = 0.1
 
     def __init__(self, db_path):
+        # db_path may also be a "file:" URI, e.g. a shared-cache memory database
         self.db_path = Path(db_path)
         self._init_database()
 
+    def _connect(self):
+        """Open a new connection to db_path (plain path or "file:" URI)"""
+        return sqlite3.connect(self.db_path, timeout=self.DB_TIMEOUT, uri=True)
+
     def _init_database(self):
         """Initialize storage directory and database - override in subclasses"""
         try:
@@ -26,7 +31,7 @@ class BaseStorage:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Subclasses should override to create their specific tables
-            conn = sqlite3.connect(self.db_path, timeout=self.DB_TIMEOUT)
+            conn = self._connect()
             conn.execute("PRAGMA journal_mode=WAL")
             self._create_tables(conn)
             conn.commit()
@@ -52,7 +57,7 @@ class BaseStorage:
         """
         conn = None
         try:
-            conn = sqlite3.connect(self.db_path, timeout=self.DB_TIMEOUT)
+            conn = self._connect()
             conn.execute("PRAGMA journal_mode=WAL")
             if readonly:
                 conn.execute("PRAGMA read_uncommitted=1")
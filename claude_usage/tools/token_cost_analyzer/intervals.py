@@ -1,6 +1,7 @@
 """Interval-building functions for token cost analysis."""
 
 from collections import defaultdict
+from operator import itemgetter
 from typing import Dict, List, Tuple
 
 import numpy as np
@@ -61,7 +62,7 @@ def build_intervals(
         empty = np.zeros((0, N_FEATURES))
         return empty, np.zeros(0), empty, np.zeros(0)
 
-    sorted_events = sorted(token_events, key=lambda e: e["timestamp"])
+    sorted_events = sorted(token_events, key=itemgetter("timestamp"))
     rows_5h, y_5h, rows_7d, y_7d = [], [], [], []
     event_idx = 0
 
@@ -120,7 +121,7 @@ def build_weighted_intervals(
 
     bucket_seconds = aggregate_hours * 3600
     bucketed = _bucket_snapshots(snapshots, bucket_seconds)
-    sorted_events = sorted(costed_events, key=lambda e: e["timestamp"])
+    sorted_events = sorted(costed_events, key=itemgetter("timestamp"))
 
     rows_5h, y_5h, rows_7d, y_7d = [], [], [], []
     model_idx = {"opus": 1, "sonnet": 2, "haiku": 3}
@@ -0,0 +1,41 @@
+"""Shared helper for tests that only check the wording of the usage panel.
+
+Used by:
+  - test_display_deviation_safe_allowance.py
+"""
+
+from rich.console import Group
+from rich.progress import Progress, TextColumn
+from rich.text import Text
+
+
+def _plain_text(renderable):
+    """Return the text content of a usage-panel renderable without styling
+
+    Text items yield their plain string; progress bars yield their text
+    columns (label and percentage) with the bar itself omitted.
+    """
+    if isinstance(renderable, Text):
+        return renderable.plain
+    if isinstance(renderable, Progress):
+        lines = []
+        for task in renderable.tasks:
+            parts = [
+                Text.from_markup(column.text_format.format(task=task)).plain
+                for column in renderable.columns
+                if isinstance(column, TextColumn)
+            ]
+            lines.append(" ".join(parts))
+        return "\n".join(lines)
+    return str(renderable)
+
+
+def render_plaintext(renderer, **render_kwargs):
+    """Return the text of renderer.render() as a plain string, one line per item
+
+    Flattens the returned Group without going through a Rich console, so no
+    styles, bars or ANSI escapes are produced.
+    """
+    result = renderer.render(**render_kwargs)
+    items = result.renderables if isinstance(result, Group) else [result]
+    return "\n".join(_plain_text(item) for item in items)
@@ -428,12 +428,25 @@ class TestCodeMonitorPacemakerBackoff(unittest.TestCase):
 class TestConsoleAPIClientBackoff(unittest.TestCase):
     """Tests for ConsoleAPIClient._handle_pagination retry logic on 429."""
 
+    @classmethod
+    def setUpClass(cls):
+        # One persistent patch for the class; tests only swap its behavior
+        cls._get_patcher = patch("claude_usage.console_mode.api._SESSION.get")
+        cls.mock_get = cls._get_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._get_patcher.stop()
+
     def setUp(self):
         self.client = ConsoleAPIClient(admin_key="test-admin-key")
         self.url = "https://api.anthropic.com/v1/test"
         self.params = {}
         self.headers = {"x-api-key": "test-admin-key"}
 
+    def tearDown(self):
+        self.mock_get.reset_mock(return_value=True, side_effect=True)
+
     def test_handle_pagination_retries_on_429(self):
         """_handle_pagination should retry when receiving 429 response."""
         mock_429 = MagicMock()
@@ -443,16 +456,16 @@ class TestConsoleAPIClientBackoff(unittest.TestCase):
         mock_200.status_code = 200
         mock_200.json.return_value = {"data": [{"item": 1}], "has_more": False}
 
-        with patch("requests.get", side_effect=[mock_429, mock_200]) as mock_get:
-            with patch("time.sleep"):
-                result, error = self.client._handle_pagination(
-                    self.url, self.params, self.headers
-                )
+        self.mock_get.side_effect = [mock_429, mock_200]
+        with patch("time.sleep"):
+            result, error = self.client._handle_pagination(
+                self.url, self.params, self.headers
+            )
 
         # Should succeed after retry
         self.assertIsNone(error)
         self.assertEqual(result, [{"item": 1}])
-        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(self.mock_get.call_count, 2)
 
     def test_handle_pagination_retry_uses_exponential_delays(self):
         """_handle_pagination should use exponential delays (4s, 8s, 16s) on 429."""
@@ -469,9 +482,9 @@ class TestConsoleAPIClientBackoff(unittest.TestCase):
             sleep_calls.append(seconds)
 
         # First call 429, second succeeds
-        with patch("requests.get", side_effect=[mock_429, mock_200]):
-            with patch("time.sleep", side_effect=capture_sleep):
-                self.client._handle_pagination(self.url, self.params, self.headers)
+        self.mock_get.side_effect = [mock_429, mock_200]
+        with patch("time.sleep", side_effect=capture_sleep):
+            self.client._handle_pagination(self.url, self.params, self.headers)
 
         self.assertEqual(len(sleep_calls), 1)
         # First retry delay should be ~4s (plus jitter up to 2s)
@@ -483,14 +496,14 @@ class TestConsoleAPIClientBackoff(unittest.TestCase):
         mock_429 = MagicMock()
         mock_429.status_code = 429
 
-        with patch("requests.get", return_value=mock_429) as mock_get:
-            with patch("time.sleep"):
-                result, error = self.client._handle_pagination(
-                    self.url, self.params, self.headers
-                )
+        self.mock_get.return_value = mock_429
+        with patch("time.sleep"):
+            result, error = self.client._handle_pagination(
+                self.url, self.params, self.headers
+            )
 
         # Should have tried 3 times (initial + 2 retries)
-        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(self.mock_get.call_count, 3)
         self.assertIsNone(result)
         self.assertIsNotNone(error)
         self.assertIn("rate limit", error.lower())
@@ -509,9 +522,9 @@ class TestConsoleAPIClientBackoff(unittest.TestCase):
             sleep_calls.append(seconds)
 
         # Two 429s then success
-        with patch("requests.get", side_effect=[mock_429, mock_429, mock_200]):
-            with patch("time.sleep", side_effect=capture_sleep):
-                self.client._handle_pagination(self.url, self.params, self.headers)
+        self.mock_get.side_effect = [mock_429, mock_429, mock_200]
+        with patch("time.sleep", side_effect=capture_sleep):
+            self.client._handle_pagination(self.url, self.params, self.headers)
 
         self.assertEqual(len(sleep_calls), 2)
         # Second retry delay should be ~8s (plus jitter)
@@ -529,9 +542,9 @@ class TestConsoleAPIClientBackoff(unittest.TestCase):
             sleep_calls.append(seconds)
 
         # Three 429s (all fail, client gives up after 3 attempts)
-        with patch("requests.get", return_value=mock_429):
-            with patch("time.sleep", side_effect=capture_sleep):
-                self.client._handle_pagination(self.url, self.params, self.headers)
+        self.mock_get.return_value = mock_429
+        with patch("time.sleep", side_effect=capture_sleep):
+            self.client._handle_pagination(self.url, self.params, self.headers)
 
         # 3 attempts = 2 sleeps (no sleep after last attempt)
         self.assertEqual(len(sleep_calls), 2)
@@ -544,11 +557,11 @@ class TestConsoleAPIClientBackoff(unittest.TestCase):
         mock_429 = MagicMock()
         mock_429.status_code = 429
 
-        with patch("requests.get", return_value=mock_429):
-            with patch("time.sleep"):
-                result, error = self.client._handle_pagination(
-                    self.url, self.params, self.headers
-                )
+        self.mock_get.return_value = mock_429
+        with patch("time.sleep"):
+            result, error = self.client._handle_pagination(
+                self.url, self.params, self.headers
+            )
 
         self.assertIsNone(result)
         self.assertIsNotNone(error)
@@ -559,14 +572,14 @@ class TestConsoleAPIClientBackoff(unittest.TestCase):
         mock_500.status_code = 500
         mock_500.text = "Internal Server Error"
 
-        with patch("requests.get", return_value=mock_500) as mock_get:
-            with patch("time.sleep") as mock_sleep:
-                result, error = self.client._handle_pagination(
-                    self.url, self.params, self.headers
-                )
+        self.mock_get.return_value = mock_500
+        with patch("time.sleep") as mock_sleep:
+            result, error = self.client._handle_pagination(
+                self.url, self.params, self.headers
+            )
 
         # Should only be called once (no retries for non-429)
-        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(self.mock_get.call_count, 1)
         mock_sleep.assert_not_called()
         self.assertIsNone(result)
 
@@ -12,16 +12,22 @@ from claude_usage.console_mode.auth import AdminAuthManager
 class TestAdminAuthManager(unittest.TestCase):
     """Test cases for AdminAuthManager class"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.credentials_path = Path(self.temp_dir) / ".credentials.json"
-
-    def tearDown(self):
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures - one temp dir shared by the whole class"""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.credentials_path = Path(cls.temp_dir) / ".credentials.json"
+
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test fixtures"""
         import shutil
 
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def tearDown(self):
+        """Remove any credentials file a test wrote"""
+        self.credentials_path.unlink(missing_ok=True)
 
     def test_load_from_env_var_takes_priority(self):
         """Test that ANTHROPIC_ADMIN_API_KEY environment variable is checked first"""
@@ -1,25 +1,78 @@
 """Tests for ConsoleAPIClient - Anthropic Console API integration"""
 
 import unittest
+from contextlib import contextmanager
 from datetime import date
-from unittest.mock import patch, Mock
+from types import SimpleNamespace
+from unittest.mock import patch
+from claude_usage.console_mode import api
 from claude_usage.console_mode.api import ConsoleAPIClient
 
+_ADMIN_KEY = "sk-ant-REDACTED"
+_EXPECTED_HEADERS = {
+    "x-api-key": _ADMIN_KEY,
+    "anthropic-version": "2023-06-01",
+    "Content-Type": "application/json",
+}
+
+# Raw cost_report pages, built once and shared read-only across tests
+_COST_RAW = (
+    {
+        "starting_at": "2025-01-01T00:00:00Z",
+        "ending_at": "2025-01-01T23:59:59Z",
+        "results": [{"currency": "USD", "amount": "10.50"}],
+    },
+)
+
+
+@contextmanager
+def swap_attr(obj, name, value):
+    """Temporarily rebind obj.name without mock.patch bookkeeping"""
+    old = getattr(obj, name)
+    setattr(obj, name, value)
+    try:
+        yield value
+    finally:
+        setattr(obj, name, old)
+
+
+def fake_response(status, payload):
+    """Build a minimal HTTP response exposing status_code and json()"""
+    return SimpleNamespace(status_code=status, json=lambda p=payload: p)
+
+
+def fake_get(*responses):
+    """Build a session.get stand-in that replays responses and records calls"""
+    pending = iter(responses)
+
+    def get(*args, **kwargs):
+        get.calls.append((args, kwargs))
+        return next(pending)
+
+    get.calls = []
+    return get
+
+
+class _FixedDate(date):
+    """date subclass whose today() is pinned to November 12, 2025"""
+
+    @classmethod
+    def today(cls):
+        return cls(2025, 11, 12)
+
 
 class TestConsoleAPIClientInit(unittest.TestCase):
     """Test cases for ConsoleAPIClient initialization"""
 
     def test_init_stores_admin_key(self):
         """Test that __init__ stores the admin API key"""
-        admin_key = "sk-ant-REDACTED"
-        client = ConsoleAPIClient(admin_key)
+        client = ConsoleAPIClient(_ADMIN_KEY)
 
-        self.assertEqual(client.admin_key, admin_key)
+        self.assertEqual(client.admin_key, _ADMIN_KEY)
 
     def test_init_sets_base_url(self):
         """Test that __init__ sets the correct base URL"""
-        admin_key = "sk-ant-REDACTED"
-        client = ConsoleAPIClient(admin_key)
+        client = ConsoleAPIClient(_ADMIN_KEY)
 
         self.assertEqual(client.base_url, "https://api.anthropic.com")
 
@@ -29,15 +82,14 @@ class TestConsoleAPIClientHeaders(unittest.TestCase):
 
     def test_get_headers_returns_required_headers(self):
         """Test that _get_headers returns all required Console API headers"""
-        admin_key = "sk-ant-REDACTED"
-        client = ConsoleAPIClient(admin_key)
+        client = ConsoleAPIClient(_ADMIN_KEY)
 
         headers = client._get_headers()
 
         self.assertIn("x-api-key", headers)
         self.assertIn("anthropic-version", headers)
         self.assertIn("Content-Type", headers)
-        self.assertEqual(headers["x-api-key"], admin_key)
+        self.assertEqual(headers["x-api-key"], _ADMIN_KEY)
         self.assertEqual(headers["anthropic-version"], "2023-06-01")
         self.assertEqual(headers["Content-Type"], "application/json")
 
@@ -45,49 +97,61 @@ class TestConsoleAPIClientHeaders(unittest.TestCase):
 class TestConsoleAPIClientDateHelpers(unittest.TestCase):
     """Test cases for date range calculation helpers"""
 
-    @patch("claude_usage.console_mode.api.date")
-    def test_calculate_mtd_range_returns_month_to_date_range(self, mock_date):
+    def test_calculate_mtd_range_returns_month_to_date_range(self):
         """Test that _calculate_mtd_range returns correct month-to-date range"""
-        # Mock today's date as November 12, 2025
-        mock_date.today.return_value = date(2025, 11, 12)
-        mock_date.side_effect = lambda *args, **kwargs: date(*args, **kwargs)
-
-        admin_key = "sk-ant-REDACTED"
-        client = ConsoleAPIClient(admin_key)
+        client = ConsoleAPIClient(_ADMIN_KEY)
 
-        starting_at, ending_at = client._calculate_mtd_range()
+        # Today is pinned to November 12, 2025
+        with swap_attr(api, "date", _FixedDate):
+            starting_at, ending_at = client._calculate_mtd_range()
 
         self.assertEqual(starting_at, "2025-11-01")
         self.assertEqual(ending_at, "2025-11-12")
 
+    def test_calculate_mtd_range_recomputes_after_date_change(self):
+        """Test that the cached MTD range is refreshed when the day changes"""
+
+        class _NextMonth(date):
+            @classmethod
+            def today(cls):
+                return cls(2025, 12, 1)
+
+        client = ConsoleAPIClient(_ADMIN_KEY)
+
+        with swap_attr(api, "date", _FixedDate):
+            self.assertEqual(
+                client._calculate_mtd_range(), ("2025-11-01", "2025-11-12")
+            )
+        with swap_attr(api, "date", _NextMonth):
+            self.assertEqual(
+                client._calculate_mtd_range(), ("2025-12-01", "2025-12-01")
+            )
+
 
 class TestConsoleAPIClientFetchOrganization(unittest.TestCase):
     """Test cases for fetch_organization method"""
 
-    @patch("claude_usage.console_mode.api.requests.get")
-    def test_fetch_organization_success(self, mock_get):
+    def test_fetch_organization_success(self):
         """Test that fetch_organization returns org data on success"""
-        # Mock successful response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "org_123", "name": "Test Organization"}
-        mock_get.return_value = mock_response
+        get = fake_get(
+            fake_response(200, {"id": "org_123", "name": "Test Organization"})
+        )
 
-        admin_key = "sk-ant-REDACTED"
-        client = ConsoleAPIClient(admin_key)
+        client = ConsoleAPIClient(_ADMIN_KEY)
 
-        result, error = client.fetch_organization()
+        with swap_attr(api._SESSION, "get", get):
+            result, error = client.fetch_organization()
 
         # Verify correct endpoint was called
-        mock_get.assert_called_once()
-        call_args = mock_get.call_args
+        self.assertEqual(len(get.calls), 1)
+        call_args = get.calls[0]
         self.assertEqual(
             call_args[0][0], "https://api.anthropic.com/v1/organizations/me"
         )
 
         # Verify headers were set correctly
         headers = call_args[1]["headers"]
-        self.assertEqual(headers["x-api-key"], admin_key)
+        self.assertEqual(headers["x-api-key"], _ADMIN_KEY)
         self.assertEqual(headers["anthropic-version"], "2023-06-01")
 
         # Verify result
@@ -98,60 +162,51 @@ class TestConsoleAPIClientFetchOrganization(unittest.TestCase):
 class TestConsoleAPIClientPagination(unittest.TestCase):
     """Test cases for pagination handling"""
 
-    @patch("claude_usage.console_mode.api.requests.get")
-    def test_handle_pagination_single_page(self, mock_get):
+    def test_handle_pagination_single_page(self):
         """Test _handle_pagination with single page response"""
-        # Mock single page response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": [{"id": 1}, {"id": 2}],
-            "has_more": False,
-        }
-        mock_get.return_value = mock_response
-
-        admin_key = "sk-ant-REDACTED"
-        client = ConsoleAPIClient(admin_key)
-
-        result, error = client._handle_pagination(
-            "https://api.anthropic.com/v1/test", {}, client._get_headers()
+        # Single page response
+        get = fake_get(
+            fake_response(200, {"data": [{"id": 1}, {"id": 2}], "has_more": False})
         )
 
+        client = ConsoleAPIClient(_ADMIN_KEY)
+
+        with swap_attr(api._SESSION, "get", get):
+            result, error = client._handle_pagination(
+                "https://api.anthropic.com/v1/test", {}, _EXPECTED_HEADERS
+            )
+
         # Should only call once
-        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(len(get.calls), 1)
         self.assertEqual(len(result), 2)
         self.assertIsNone(error)
 
-    @patch("claude_usage.console_mode.api.requests.get")
-    def test_handle_pagination_multiple_pages(self, mock_get):
+    def test_handle_pagination_multiple_pages(self):
         """Test _handle_pagination with multiple pages"""
-        # Mock two-page response
-        page1_response = Mock()
-        page1_response.status_code = 200
-        page1_response.json.return_value = {
-            "data": [{"id": 1}, {"id": 2}],
-            "has_more": True,
-            "next_page_token": "token_123",
-        }
-
-        page2_response = Mock()
-        page2_response.status_code = 200
-        page2_response.json.return_value = {
-            "data": [{"id": 3}, {"id": 4}],
-            "has_more": False,
-        }
-
-        mock_get.side_effect = [page1_response, page2_response]
-
-        admin_key = "sk-ant-REDACTED"
-        client = ConsoleAPIClient(admin_key)
-
-        result, error = client._handle_pagination(
-            "https://api.anthropic.com/v1/test", {}, client._get_headers()
+        # Two-page response
+        page1_response = fake_response(
+            200,
+            {
+                "data": [{"id": 1}, {"id": 2}],
+                "has_more": True,
+                "next_page_token": "token_123",
+            },
+        )
+        page2_response = fake_response(
+            200, {"data": [{"id": 3}, {"id": 4}], "has_more": False}
         )
 
+        get = fake_get(page1_response, page2_response)
+
+        client = ConsoleAPIClient(_ADMIN_KEY)
+
+        with swap_attr(api._SESSION, "get", get):
+            result, error = client._handle_pagination(
+                "https://api.anthropic.com/v1/test", {}, _EXPECTED_HEADERS
+            )
+
         # Should call twice
-        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(len(get.calls), 2)
         self.assertEqual(len(result), 4)
         self.assertIsNone(error)
 
@@ -163,17 +218,9 @@ class TestConsoleAPIClientFetchCostReport(unittest.TestCase):
     def test_fetch_cost_report_success(self, mock_pagination):
         """Test that fetch_cost_report returns aggregated cost data on success"""
         # Mock pagination returns raw API response
-        raw_data = [
-            {
-                "starting_at": "2025-01-01T00:00:00Z",
-                "ending_at": "2025-01-01T23:59:59Z",
-                "results": [{"currency": "USD", "amount": "10.50"}],
-            }
-        ]
-        mock_pagination.return_value = (raw_data, None)
-
-        admin_key = "sk-ant-REDACTED"
-        client = ConsoleAPIClient(admin_key)
+        mock_pagination.return_value = (list(_COST_RAW), None)
+
+        client = ConsoleAPIClient(_ADMIN_KEY)
 
         result, error = client.fetch_cost_report("2025-01-01", "2025-01-31")
 
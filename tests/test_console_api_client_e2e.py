@@ -4,19 +4,17 @@ import unittest
 import os
 from claude_usage.console_mode.api import ConsoleAPIClient
 
+ADMIN_KEY = os.environ.get("ANTHROPIC_ADMIN_API_KEY")
+if not ADMIN_KEY:
+    raise unittest.SkipTest("ANTHROPIC_ADMIN_API_KEY environment variable not set")
+
 
 class TestConsoleAPIClientE2E(unittest.TestCase):
     """End-to-end tests against real Console API"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.admin_key = os.environ.get("ANTHROPIC_ADMIN_API_KEY")
-        if not self.admin_key:
-            self.skipTest("ANTHROPIC_ADMIN_API_KEY environment variable not set")
-
     def test_fetch_organization_real_api(self):
         """Test fetch_organization against real Console API"""
-        client = ConsoleAPIClient(self.admin_key)
+        client = ConsoleAPIClient(ADMIN_KEY)
 
         result, error = client.fetch_organization()
 
@@ -9,10 +9,14 @@ from __future__ import annotations
 import json
 import tempfile
 import unittest
+from datetime import datetime
 from io import StringIO
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+from rich.console import Console
+
 from claude_usage.console_mode.display import ConsoleRenderer
 from claude_usage.console_mode.monitor import ConsoleMonitor
 
@@ -28,13 +32,14 @@ FAKE_ACCOUNT_CREATED = "2024-01-15T10:00:00Z"
 FAKE_PRIMARY_KEY = "fake-primary-api-key-for-testing"
 
 
-def _render_to_str(renderable, width: int = 120) -> str:
-    """Render any Rich renderable to a plain string via Console capture."""
-    from rich.console import Console
+# Shared by every render in this module; capture() isolates each output
+_CONSOLE = Console(file=StringIO(), width=120, force_terminal=True)
+
 
-    con = Console(file=StringIO(), width=width, force_terminal=True)
-    with con.capture() as capture:
-        con.print(renderable)
+def _render_to_str(renderable) -> str:
+    """Render any Rich renderable to a plain string via Console capture."""
+    with _CONSOLE.capture() as capture:
+        _CONSOLE.print(renderable)
     return capture.get()
 
 
@@ -61,6 +66,38 @@ def _make_settings_info(
     }
 
 
+def _returning(value):
+    """Return a callable that ignores its arguments and returns *value*."""
+    return lambda *args, **kwargs: value
+
+
+def _make_pacemaker_reader(**overrides):
+    """Build an installed PaceMakerReader stub with default return values.
+
+    Keyword arguments override the return value of the named reader method.
+    A SimpleNamespace is enough here: no test asserts on reader calls.
+    """
+    returns = {
+        "is_installed": True,
+        "get_status": {"enabled": True, "has_data": True},
+        "get_blockage_stats_with_labels": {},
+        "get_langfuse_metrics": {"total_traces": 10},
+        "get_secrets_metrics": {"total": 2},
+        "get_governance_events": [{"ts": 1000, "decision": "allow", "feedback": "ok"}],
+        "get_langfuse_status": False,
+        "test_langfuse_connection": {"connected": False},
+        "get_pacemaker_version": "unknown",
+        "get_recent_error_count": 0,
+        "get_recent_activity": [],
+        "_get_pacemaker_src_path": None,
+    }
+    returns.update(overrides)
+
+    return SimpleNamespace(
+        **{name: _returning(value) for name, value in returns.items()}
+    )
+
+
 class TestConsoleMonitorLoadsSettingsInfo(unittest.TestCase):
     """ConsoleMonitor._load_settings_info() reads oauthAccount from ~/.claude.json."""
 
@@ -145,8 +182,10 @@ class TestConsoleMonitorLoadsSettingsInfo(unittest.TestCase):
 class TestConsoleRendererSettingsPanel(unittest.TestCase):
     """ConsoleRenderer.render_settings_panel() renders all settings fields."""
 
-    def setUp(self):
-        self.renderer = ConsoleRenderer()
+    @classmethod
+    def setUpClass(cls):
+        # ConsoleRenderer holds no state, so one instance serves every test
+        cls.renderer = ConsoleRenderer()
 
     def test_console_renderer_settings_panel_shows_all_fields(self):
         """render_settings_panel shows email, org, role, billing, key status."""
@@ -189,14 +228,16 @@ class TestConsoleRendererSettingsPanel(unittest.TestCase):
 class TestConsoleRendererErrorBehavior(unittest.TestCase):
     """ConsoleRenderer.render() error branch behavior based on admin key presence."""
 
-    def setUp(self):
-        self.renderer = ConsoleRenderer()
+    @classmethod
+    def setUpClass(cls):
+        # ConsoleRenderer holds no state, so one instance serves every test
+        cls.renderer = ConsoleRenderer()
 
-    def test_console_renderer_friendly_admin_key_error_when_missing(self):
-        """When error set AND admin_api_key_source is None → show friendly hint."""
+    def _render_error(self, admin_api_key_source):
+        """Render the error branch with the given admin key source as text."""
         info = _make_settings_info(
             primary_api_key_present=True,
-            admin_api_key_source=None,
+            admin_api_key_source=admin_api_key_source,
         )
         renderable = self.renderer.render(
             org_data=None,
@@ -207,56 +248,30 @@ class TestConsoleRendererErrorBehavior(unittest.TestCase):
             error="Authentication failed",
             settings_info=info,
         )
-        text = _render_to_str(renderable)
+        return _render_to_str(renderable)
+
+    def test_console_renderer_friendly_admin_key_error_when_missing(self):
+        """When error set AND admin_api_key_source is None → show friendly hint."""
+        text = self._render_error(None)
 
         self.assertIn("Admin API key", text)
         self.assertIn("platform.claude.com/settings/admin-keys", text)
         self.assertIn("anthropicConsole", text)
         self.assertIn("adminApiKey", text)
 
-    def test_console_renderer_generic_error_when_admin_key_present(self):
-        """When error set AND admin_api_key_source is not None → generic error, no hint."""
-        info = _make_settings_info(
-            primary_api_key_present=True,
-            admin_api_key_source="environment",
-        )
-        renderable = self.renderer.render(
-            org_data=None,
-            mtd_data=None,
-            workspaces=None,
-            last_update=None,
-            projection=None,
-            error="Authentication failed",
-            settings_info=info,
-        )
-        text = _render_to_str(renderable)
-
-        # Friendly hint must NOT appear
-        self.assertNotIn("platform.claude.com/settings/admin-keys", text)
-        # But error must still be visible
-        self.assertIn("Authentication failed", text)
+    def test_console_renderer_generic_error_when_admin_key_source_set(self):
+        """When error set AND source is not None → generic error, no hint.
 
-    def test_console_renderer_generic_error_when_claude_json_primary_source(self):
-        """When source is 'claude_json_primary' (non-None), show generic error — no friendly hint."""
-        info = _make_settings_info(
-            primary_api_key_present=True,
-            admin_api_key_source="claude_json_primary",
-        )
-        renderable = self.renderer.render(
-            org_data=None,
-            mtd_data=None,
-            workspaces=None,
-            last_update=None,
-            projection=None,
-            error="Authentication failed",
-            settings_info=info,
-        )
-        text = _render_to_str(renderable)
+        'claude_json_primary' is included: only a None source triggers the hint.
+        """
+        for source in ("environment", "claude_json_primary"):
+            with self.subTest(source=source):
+                text = self._render_error(source)
 
-        # Friendly hint must NOT appear — only None source triggers it now
-        self.assertNotIn("platform.claude.com/settings/admin-keys", text)
-        # Generic error must still be visible
-        self.assertIn("Authentication failed", text)
+                # Friendly hint must NOT appear
+                self.assertNotIn("platform.claude.com/settings/admin-keys", text)
+                # But error must still be visible
+                self.assertIn("Authentication failed", text)
 
 
 class TestConsoleMonitorIntegratesPaceMakerReader(unittest.TestCase):
@@ -278,20 +293,11 @@ class TestConsoleMonitorIntegratesPaceMakerReader(unittest.TestCase):
         """Pace-maker data is captured even when admin API fetch fails."""
         fake_status = {"enabled": True, "has_data": True}
         fake_blockage = {"Intent": 3, "TDD": 1}
-        fake_langfuse = {"total_traces": 10}
-        fake_secrets = {"total": 2}
-        fake_events = [{"ts": 1000, "decision": "allow", "feedback": "ok"}]
-
-        mock_reader = MagicMock()
-        mock_reader.is_installed.return_value = True
-        mock_reader.get_status.return_value = fake_status
-        mock_reader.get_blockage_stats_with_labels.return_value = fake_blockage
-        mock_reader.get_langfuse_metrics.return_value = fake_langfuse
-        mock_reader.get_secrets_metrics.return_value = fake_secrets
-        mock_reader.get_governance_events.return_value = fake_events
-        mock_reader.get_langfuse_status.return_value = False
-        mock_reader.test_langfuse_connection.return_value = {"connected": False}
-        mock_reader.get_recent_activity.return_value = []
+
+        mock_reader = _make_pacemaker_reader(
+            get_status=fake_status,
+            get_blockage_stats_with_labels=fake_blockage,
+        )
 
         with patch(
             "claude_usage.console_mode.monitor.Path.home",
@@ -320,5 +326,63 @@ class TestConsoleMonitorIntegratesPaceMakerReader(unittest.TestCase):
         self.assertEqual(monitor.blockage_stats, fake_blockage)
 
 
+class TestConsoleMonitorEOMProjection(unittest.TestCase):
+    """EOM projection hours are derived from one datetime.now() reading."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.credentials_path = Path(self.temp_dir) / ".credentials.json"
+        self.fake_home = Path(self.temp_dir) / "home"
+        self.fake_home.mkdir()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_eom_projection_uses_frozen_clock(self):
+        """Freezing only datetime.now() fixes hours_until_eom exactly."""
+
+        class _FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return cls(2025, 1, 15, 12, 0, 0)
+
+        with patch(
+            "claude_usage.console_mode.monitor.Path.home",
+            return_value=self.fake_home,
+        ):
+            monitor = ConsoleMonitor(self.credentials_path)
+
+        monitor.console_client = MagicMock()
+        monitor.console_client.fetch_organization.return_value = ({"id": "org"}, None)
+        monitor.console_client._calculate_mtd_range.return_value = (
+            "2025-01-01",
+            "2025-01-15",
+        )
+        monitor.console_client.fetch_cost_report.return_value = (
+            {"claude_code_user_cost_usd": 20.0},
+            None,
+        )
+        monitor.analytics = MagicMock()
+        monitor.analytics.calculate_console_mtd_rate.return_value = 1.0
+        monitor.analytics.project_console_eom_cost.side_effect = (
+            lambda cost, rate, hours: cost + rate * hours
+        )
+        monitor.storage = MagicMock()
+
+        with patch.object(monitor, "_fetch_pacemaker_data"), patch.object(
+            monitor, "_load_settings_info", return_value={}
+        ), patch("claude_usage.console_mode.monitor.datetime", _FrozenDatetime):
+            monitor.fetch_console_data()
+
+        # Jan 15 12:00:00 -> Jan 31 23:59:59 is 16 days, 11h 59m 59s
+        expected_hours = (16 * 86400 + 11 * 3600 + 59 * 60 + 59) / 3600
+        self.assertAlmostEqual(
+            monitor.eom_projection["hours_until_eom"], expected_hours
+        )
+        self.assertAlmostEqual(
+            monitor.eom_projection["projected_cost"], 20.0 + expected_hours
+        )
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,10 @@
 """Tests for display module"""
 
+import io
 import unittest
-from unittest.mock import patch, MagicMock
+import pytest
+from rich.console import Console
+from rich.progress import BarColumn, Progress
 from rich.text import Text
 from rich.errors import MarkupError
 from claude_usage.code_mode.display import UsageRenderer, _format_feedback_lines
@@ -10,9 +13,10 @@ from claude_usage.code_mode.display import UsageRenderer, _format_feedback_lines
 class TestUsageRenderer(unittest.TestCase):
     """Test cases for UsageRenderer class"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.renderer = UsageRenderer()
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures - UsageRenderer is stateless, so share one"""
+        cls.renderer = UsageRenderer()
 
     def test_render_five_hour_limit_bar_column_style_parameters(self):
         """Test that BarColumn uses correct style parameters for progress bar
@@ -27,133 +31,31 @@ class TestUsageRenderer(unittest.TestCase):
         - 50% utilization shows half colored bar with half remaining neutral
         - 100% utilization shows full colored bar
         """
-        # Mock the Progress class to capture BarColumn initialization
-        with patch("claude_usage.code_mode.display.Progress") as mock_progress_class:
-            # Create a mock Progress instance
-            mock_progress = MagicMock()
-            mock_progress_class.return_value = mock_progress
-
-            # Mock the add_task method to return a task ID
-            mock_progress.add_task.return_value = 1
-
-            # Test data with low utilization (2%)
-            five_hour_data = {
-                "utilization": 2,
-                "resets_at": "2025-11-12T23:00:00+00:00",
-            }
-
-            content = []
-
-            # Call the method that creates the progress bar
-            self.renderer._render_five_hour_limit(content, five_hour_data)
-
-            # Verify Progress was called
-            self.assertTrue(mock_progress_class.called)
-
-            # Get the BarColumn from the call arguments
-            call_args = mock_progress_class.call_args
-            columns = call_args[0] if call_args[0] else []
-
-            # Find the BarColumn in the columns
-            bar_column = None
-            for col in columns:
-                if col.__class__.__name__ == "BarColumn":
-                    bar_column = col
-                    break
-
-            self.assertIsNotNone(bar_column, "BarColumn should be present in Progress")
-
-            # The critical assertion: BarColumn should NOT have style parameter
-            # set to the bar_style (green/yellow/red), or it should be None/neutral
-            # We check the BarColumn's __dict__ or constructor parameters
-
-            # Since we're mocking, we need to inspect the actual call
-            # Let's verify the BarColumn initialization parameters
-            bar_column_init_kwargs = {}
-            for col in columns:
-                if hasattr(col, "__class__") and col.__class__.__name__ == "BarColumn":
-                    # Check if the column has a style attribute that's not neutral
-                    if hasattr(col, "style"):
-                        bar_column_init_kwargs["style"] = col.style
-                    if hasattr(col, "complete_style"):
-                        bar_column_init_kwargs["complete_style"] = col.complete_style
-                    if hasattr(col, "finished_style"):
-                        bar_column_init_kwargs["finished_style"] = col.finished_style
-
-            # The test should FAIL initially because style=bar_style is set
-            # After fix, style should be None, 'bar.back', or not set
-            # This test verifies the bug exists
-            if "style" in bar_column_init_kwargs:
-                style_value = bar_column_init_kwargs.get("style")
-                # Style should be None, 'bar.back', 'bar.complete', or similar neutral color
-                # NOT 'bold green', 'bold yellow', 'bold bright_yellow', or 'bold red'
-                self.assertNotIn(
-                    style_value,
-                    ["bold green", "bold yellow", "bold bright_yellow", "bold red"],
-                    "BarColumn style parameter should not be set to bar_style colors. "
-                    "This causes the entire bar to appear filled even at low utilization.",
-                )
-
-    def test_render_five_hour_limit_different_utilization_levels(self):
-        """Test that different utilization levels produce appropriate bar styles
-
-        Verify that:
-        - Low utilization (< 51%) uses green
-        - Medium utilization (51-80%) uses yellow
-        - High utilization (81-99%) uses bright yellow
-        - Full utilization (>= 100%) uses red
-        """
-        test_cases = [
-            (2, "bold green"),
-            (50, "bold green"),
-            (51, "bold yellow"),
-            (80, "bold yellow"),
-            (81, "bold bright_yellow"),
-            (99, "bold bright_yellow"),
-            (100, "bold red"),
-            (150, "bold red"),
-        ]
-
-        for utilization, expected_style in test_cases:
-            with self.subTest(utilization=utilization):
-                with patch(
-                    "claude_usage.code_mode.display.Progress"
-                ) as mock_progress_class:
-                    mock_progress = MagicMock()
-                    mock_progress_class.return_value = mock_progress
-                    mock_progress.add_task.return_value = 1
-
-                    five_hour_data = {
-                        "utilization": utilization,
-                        "resets_at": "2025-11-12T23:00:00+00:00",
-                    }
-
-                    content = []
-                    self.renderer._render_five_hour_limit(content, five_hour_data)
-
-                    # Verify the correct color style is being used for complete_style
-                    # and finished_style (not for style parameter)
-                    call_args = mock_progress_class.call_args
-                    columns = call_args[0] if call_args[0] else []
-
-                    # Find BarColumn and verify complete_style matches expected
-                    for col in columns:
-                        if (
-                            hasattr(col, "__class__")
-                            and col.__class__.__name__ == "BarColumn"
-                        ):
-                            if hasattr(col, "complete_style"):
-                                self.assertEqual(
-                                    col.complete_style,
-                                    expected_style,
-                                    f"At {utilization}% utilization, complete_style should be {expected_style}",
-                                )
-                            if hasattr(col, "finished_style"):
-                                self.assertEqual(
-                                    col.finished_style,
-                                    expected_style,
-                                    f"At {utilization}% utilization, finished_style should be {expected_style}",
-                                )
+        # Progress is only constructed here (never started), so the real class
+        # can be used and its BarColumn inspected directly
+        five_hour_data = {
+            "utilization": 2,
+            "resets_at": "2025-11-12T23:00:00+00:00",
+        }
+
+        content = []
+        self.renderer._render_five_hour_limit(content, five_hour_data)
+
+        self.assertIsInstance(content[0], Progress)
+        bar_columns = [col for col in content[0].columns if isinstance(col, BarColumn)]
+        self.assertEqual(len(bar_columns), 1, "BarColumn should be present in Progress")
+        bar_column = bar_columns[0]
+
+        # The critical assertion: BarColumn style (the incomplete portion) must
+        # stay neutral; only the filled portion carries the bar_style color.
+        # Otherwise the entire bar appears filled even at low utilization.
+        self.assertNotIn(
+            bar_column.style,
+            ["bold green", "bold yellow", "bold bright_yellow", "bold red"],
+            "BarColumn style parameter should not be set to bar_style colors.",
+        )
+        self.assertEqual(bar_column.complete_style, "bold green")
+        self.assertEqual(bar_column.finished_style, "bold green")
 
     def test_render_five_hour_limit_creates_progress_bar(self):
         """Test that _render_five_hour_limit creates a progress bar with correct values"""
@@ -167,11 +69,54 @@ class TestUsageRenderer(unittest.TestCase):
         self.assertEqual(len(content), 3)
 
         # First item should be a Progress instance
-        from rich.progress import Progress
-
         self.assertIsInstance(content[0], Progress)
 
 
+@pytest.fixture(scope="module")
+def renderer():
+    """Module-wide UsageRenderer; it keeps no state between renders"""
+    return UsageRenderer()
+
+
+class TestFiveHourLimitBarStyles:
+    """Bar styles per utilization level for the 5-hour limit progress bar
+
+    Low utilization (< 51%) uses green, medium (51-80%) yellow, high (81-99%)
+    bright yellow and full (>= 100%) red.
+    """
+
+    @pytest.mark.parametrize(
+        "utilization,expected_style",
+        [
+            (2, "bold green"),
+            (50, "bold green"),
+            (51, "bold yellow"),
+            (80, "bold yellow"),
+            (81, "bold bright_yellow"),
+            (99, "bold bright_yellow"),
+            (100, "bold red"),
+            (150, "bold red"),
+        ],
+    )
+    def test_utilization_level_sets_bar_style(
+        self, renderer, utilization, expected_style
+    ):
+        """complete_style and finished_style follow the utilization level"""
+        five_hour_data = {
+            "utilization": utilization,
+            "resets_at": "2025-11-12T23:00:00+00:00",
+        }
+
+        content = []
+        renderer._render_five_hour_limit(content, five_hour_data)
+
+        bar_column = next(
+            col for col in content[0].columns if isinstance(col, BarColumn)
+        )
+        assert bar_column.complete_style == expected_style
+        assert bar_column.finished_style == expected_style
+
+
 class TestFormatFeedbackLines(unittest.TestCase):
     """Regression tests for _format_feedback_lines markup safety."""
 
@@ -189,9 +134,6 @@ class TestFormatFeedbackLines(unittest.TestCase):
 
         Observable symptom: '/cyan]' appears as literal text in the rendered output.
         """
-        import io
-        from rich.console import Console
-
         # This string contains a literal '[' (escaped by _md_to_rich to '\\[') which
         # throws off textwrap's width accounting, causing it to split inside
         # the [cyan]...[/cyan] tags injected around the backtick span.
@@ -11,30 +11,86 @@ Critical test case:
     Old behavior: deviation=-4%, throttling=TRUE (CONTRADICTION!)
 """
 
+import re
 import unittest
 from datetime import datetime
+from types import MappingProxyType
+from io import StringIO
+from rich.console import Console
 from claude_usage.code_mode.display import UsageRenderer
+from tests.plaintext_helpers import render_plaintext
+
+_CONSOLE = Console(file=StringIO(), width=100)
+
+# Signed deviation on a "Deviation"/"over"/"under" line of the rendered panel;
+# the throttling scenario expects about +0.75%, so "+0." or "+1."
+_POS_DEV_RE = re.compile(r"(?mi)^.*(?:Deviation|over).*[+][01]\.\d+%")
+_NEG_DEV_RE = re.compile(r"(?mi)^.*(?:Deviation|under).*-\d+\.\d+%")
+# Fresh 92% against a 90.25% safe allowance gives about +1.75%: "+1." or "+2."
+_FRESH_DEV_RE = re.compile(r"(?mi)^.*(?:Deviation|over).*[+][12]\.\d+%")
 
 
 class TestDeviationFromSafeAllowance(unittest.TestCase):
     """Test that deviation is calculated from safe_allowance, not target"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.renderer = UsageRenderer()
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures - one stateless renderer for the class"""
+        cls.renderer = UsageRenderer()
+        # last_update is not asserted on; a fixed value keeps renders deterministic
+        cls.FIXED_NOW = datetime(2025, 11, 15, 10, 0, 0)
+        # Read-only templates; each test copies them and sets the fields it varies
+        cls.BASE_USAGE = MappingProxyType(
+            {
+                "five_hour": MappingProxyType(
+                    {
+                        "utilization": 0.0,
+                        "resets_at": "2025-11-15T12:00:00+00:00",
+                    }
+                )
+            }
+        )
+        cls.BASE_PM = MappingProxyType(
+            {
+                "enabled": True,
+                "has_data": True,
+                "should_throttle": False,
+                "delay_seconds": 0,
+                "constrained_window": "5-hour",
+                "five_hour": MappingProxyType(
+                    {
+                        "utilization": 0.0,
+                        "target": 95.0,
+                        "time_elapsed_pct": 50.0,
+                    }
+                ),
+                "deviation_percent": 0.0,
+                "strategy": "none",
+            }
+        )
 
-    def _extract_deviation_from_render(self, panel):
-        """Helper to extract deviation value from rendered panel"""
-        # Use Rich's render capability to convert to plain text
-        from io import StringIO
-        from rich.console import Console
+    def _usage(self, utilization):
+        """Build last_usage from BASE_USAGE with the given fresh utilization"""
+        return {
+            "five_hour": {**self.BASE_USAGE["five_hour"], "utilization": utilization}
+        }
 
-        console = Console(file=StringIO(), width=100)
-        with console.capture() as capture:
-            console.print(panel)
+    def _pacemaker_status(self, five_hour=None, **overrides):
+        """Build pacemaker_status from BASE_PM with per-test overrides"""
+        pm = dict(self.BASE_PM)
+        pm["five_hour"] = {**self.BASE_PM["five_hour"], **(five_hour or {})}
+        pm.update(overrides)
+        return pm
 
-        output = capture.get()
-        return output
+    def _extract_deviation_from_render(self, panel):
+        """Helper to extract deviation value from rendered panel"""
+        # Use Rich's render capability to convert to plain text, reusing the
+        # module console with its buffer reset
+        buf = _CONSOLE.file
+        buf.seek(0)
+        buf.truncate(0)
+        _CONSOLE.print(panel)
+        return buf.getvalue()
 
     def test_deviation_positive_when_throttling(self):
         """When throttling is active, deviation MUST be positive (over safe_allowance)"""
@@ -42,42 +98,27 @@ class TestDeviationFromSafeAllowance(unittest.TestCase):
         # Old: deviation=-4% (contradicts throttling)
         # New: deviation=+0.75% (matches throttling)
 
-        last_usage = {
-            "five_hour": {
-                "utilization": 91.0,  # Fresh actual utilization
-                "resets_at": "2025-11-15T12:00:00+00:00",
-            }
-        }
+        last_usage = self._usage(91.0)  # Fresh actual utilization
 
-        pacemaker_status = {
-            "enabled": True,
-            "has_data": True,
-            "should_throttle": True,  # THROTTLING active
-            "delay_seconds": 30,
-            "constrained_window": "5-hour",
-            "five_hour": {
-                "utilization": 91.0,
-                "target": 95.0,  # Target is 95%
-                "time_elapsed_pct": 50.0,
-            },
-            "deviation_percent": -4.0,  # OLD WRONG VALUE (from pm_status)
-
-            "strategy": "gradual",
-        }
+        pacemaker_status = self._pacemaker_status(
+            five_hour={"utilization": 91.0},  # Target is 95%
+            should_throttle=True,  # THROTTLING active
+            delay_seconds=30,
+            deviation_percent=-4.0,  # OLD WRONG VALUE (from pm_status)
+            strategy="gradual",
+        )
 
         # Render panel
-        panel = self.renderer.render(
+        output = render_plaintext(
+            self.renderer,
             error_message=None,
             last_usage=last_usage,
             last_profile=None,
-            last_update=datetime.utcnow(),
+            last_update=self.FIXED_NOW,
             pacemaker_status=pacemaker_status,
             weekly_limit_enabled=True,
         )
 
-        # Extract rendered text
-        output = self._extract_deviation_from_render(panel)
-
         # Verify: Should show POSITIVE deviation when throttling
         # Expected: "+0.75% over budget" or similar positive value
         # Should NOT show "-4% under budget" (contradictory!)
@@ -85,15 +126,10 @@ class TestDeviationFromSafeAllowance(unittest.TestCase):
 
         # Check for positive deviation indicator
         # Looking for "+X%" pattern in deviation line
-        has_positive_deviation = any(
-            "+0." in line or "+1." in line
-            for line in output.split("\n")
-            if "Deviation" in line or "over" in line
-        )
-
-        self.assertTrue(
-            has_positive_deviation,
-            f"Deviation should be positive when throttling. Got: {output}",
+        self.assertRegex(
+            output,
+            _POS_DEV_RE,
+            f"Deviation should be about +0.75% when throttling. Got: {output}",
         )
 
         # Should NOT show "under budget" when throttling
@@ -108,52 +144,31 @@ class TestDeviationFromSafeAllowance(unittest.TestCase):
         # Scenario: actual=30%, target=50%, safe=47.5%
         # Expected: deviation=-17.5%, throttling=FALSE
 
-        last_usage = {
-            "five_hour": {
-                "utilization": 30.0,  # Well under safe allowance
-                "resets_at": "2025-11-15T12:00:00+00:00",
-            }
-        }
+        last_usage = self._usage(30.0)  # Well under safe allowance
 
-        pacemaker_status = {
-            "enabled": True,
-            "has_data": True,
-            "should_throttle": False,  # NOT throttling
-            "delay_seconds": 0,
-            "constrained_window": "5-hour",
-            "five_hour": {
-                "utilization": 30.0,
-                "target": 50.0,
-                "time_elapsed_pct": 40.0,
-            },
-            "deviation_percent": -20.0,  # OLD VALUE (from target)
-
-            "strategy": "none",
-        }
+        pacemaker_status = self._pacemaker_status(
+            five_hour={"utilization": 30.0, "target": 50.0, "time_elapsed_pct": 40.0},
+            should_throttle=False,  # NOT throttling
+            deviation_percent=-20.0,  # OLD VALUE (from target)
+        )
 
-        panel = self.renderer.render(
+        output = render_plaintext(
+            self.renderer,
             error_message=None,
             last_usage=last_usage,
             last_profile=None,
-            last_update=datetime.utcnow(),
+            last_update=self.FIXED_NOW,
             pacemaker_status=pacemaker_status,
             weekly_limit_enabled=True,
         )
 
-        output = self._extract_deviation_from_render(panel)
-
         # Verify: Should show NEGATIVE deviation when not throttling
         self.assertIn("ON PACE", output, "Should show on-pace status")
 
         # Check for negative deviation
-        has_negative_deviation = any(
-            "-" in line and "%" in line
-            for line in output.split("\n")
-            if "Deviation" in line or "under" in line
-        )
-
-        self.assertTrue(
-            has_negative_deviation,
+        self.assertRegex(
+            output,
+            _NEG_DEV_RE,
             f"Deviation should be negative when not throttling. Got: {output}",
         )
 
@@ -169,87 +184,55 @@ class TestDeviationFromSafeAllowance(unittest.TestCase):
         # Scenario: pm_status has stale data (90%), last_usage has fresh data (92%)
         # Deviation MUST use fresh 92%, not stale 90%
 
-        last_usage = {
-            "five_hour": {
-                "utilization": 92.0,  # FRESH data
-                "resets_at": "2025-11-15T12:00:00+00:00",
-            }
-        }
+        last_usage = self._usage(92.0)  # FRESH data
 
-        pacemaker_status = {
-            "enabled": True,
-            "has_data": True,
-            "should_throttle": True,
-            "delay_seconds": 45,
-            "constrained_window": "5-hour",
-            "five_hour": {
-                "utilization": 90.0,  # STALE data (30 seconds old)
-                "target": 95.0,
-                "time_elapsed_pct": 50.0,
-            },
-            "deviation_percent": -5.0,  # Based on stale 90%
-
-            "strategy": "gradual",
-        }
+        pacemaker_status = self._pacemaker_status(
+            five_hour={"utilization": 90.0},  # STALE data (30 seconds old)
+            should_throttle=True,
+            delay_seconds=45,
+            deviation_percent=-5.0,  # Based on stale 90%
+            strategy="gradual",
+        )
 
-        panel = self.renderer.render(
+        output = render_plaintext(
+            self.renderer,
             error_message=None,
             last_usage=last_usage,
             last_profile=None,
-            last_update=datetime.utcnow(),
+            last_update=self.FIXED_NOW,
             pacemaker_status=pacemaker_status,
             weekly_limit_enabled=True,
         )
 
-        output = self._extract_deviation_from_render(panel)
-
         # Verify: Should use FRESH 92% for deviation calculation
         # safe_allowance = 95 * 0.95 = 90.25
         # deviation = 92 - 90.25 = +1.75%
         # Should show positive deviation based on fresh data
 
-        has_positive_deviation = any(
-            "+1." in line or "+2." in line
-            for line in output.split("\n")
-            if "Deviation" in line or "over" in line
-        )
-
-        self.assertTrue(
-            has_positive_deviation,
+        self.assertRegex(
+            output,
+            _FRESH_DEV_RE,
             f"Deviation should reflect fresh utilization (92%), not stale (90%). Got: {output}",
         )
 
     def test_deviation_color_coding_matches_throttling(self):
         """Color coding should match throttling state consistently"""
         # Test 1: Throttling active → red/yellow color, positive deviation
-        last_usage_throttling = {
-            "five_hour": {
-                "utilization": 96.0,  # Over safe allowance
-                "resets_at": "2025-11-15T12:00:00+00:00",
-            }
-        }
-
-        pacemaker_status_throttling = {
-            "enabled": True,
-            "has_data": True,
-            "should_throttle": True,
-            "delay_seconds": 60,
-            "constrained_window": "5-hour",
-            "five_hour": {
-                "utilization": 96.0,
-                "target": 95.0,
-                "time_elapsed_pct": 50.0,
-            },
-            "deviation_percent": 1.0,  # OLD calculation
-
-            "strategy": "aggressive",
-        }
+        last_usage_throttling = self._usage(96.0)  # Over safe allowance
+
+        pacemaker_status_throttling = self._pacemaker_status(
+            five_hour={"utilization": 96.0},
+            should_throttle=True,
+            delay_seconds=60,
+            deviation_percent=1.0,  # OLD calculation
+            strategy="aggressive",
+        )
 
         panel = self.renderer.render(
             error_message=None,
             last_usage=last_usage_throttling,
             last_profile=None,
-            last_update=datetime.utcnow(),
+            last_update=self.FIXED_NOW,
             pacemaker_status=pacemaker_status_throttling,
             weekly_limit_enabled=True,
         )
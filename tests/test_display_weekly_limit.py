@@ -5,13 +5,27 @@ from io import StringIO
 from claude_usage.code_mode.display import UsageRenderer
 from rich.console import Console
 
+# One console for the module; its buffer is reset before every render.
+# Assertions only look for substrings, so no terminal or colour output.
+_CONSOLE = Console(file=StringIO(), width=120, color_system=None)
+
+
+def _render_to_str(panel):
+    """Render a panel through the shared console and return the output"""
+    buf = _CONSOLE.file
+    buf.seek(0)
+    buf.truncate(0)
+    _CONSOLE.print(panel)
+    return buf.getvalue()
+
 
 class TestDisplayWeeklyLimit(unittest.TestCase):
     """Test weekly_limit_enabled conditional rendering in UsageRenderer"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.renderer = UsageRenderer()
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures - one stateless renderer for the class"""
+        cls.renderer = UsageRenderer()
 
     def test_render_includes_7day_section_when_weekly_limit_enabled_true(self):
         """Test that 7-day section is rendered when weekly_limit_enabled=True"""
@@ -57,9 +71,7 @@ class TestDisplayWeeklyLimit(unittest.TestCase):
         )
 
         # Render panel to string
-        console = Console(file=StringIO(), force_terminal=True, width=120)
-        console.print(panel)
-        panel_str = console.file.getvalue()
+        panel_str = _render_to_str(panel)
 
         # Verify 7-day section is present
         self.assertIn("7-Day", panel_str)
@@ -108,9 +120,7 @@ class TestDisplayWeeklyLimit(unittest.TestCase):
         )
 
         # Render panel to string
-        console = Console(file=StringIO(), force_terminal=True, width=120)
-        console.print(panel)
-        panel_str = console.file.getvalue()
+        panel_str = _render_to_str(panel)
 
         # Verify 7-day section IS present (usage still reported)
         self.assertIn("7-Day", panel_str)
@@ -154,9 +164,7 @@ class TestDisplayWeeklyLimit(unittest.TestCase):
         )
 
         # Render panel to string
-        console = Console(file=StringIO(), force_terminal=True, width=120)
-        console.print(panel)
-        panel_str = console.file.getvalue()
+        panel_str = _render_to_str(panel)
 
         # Verify appropriate messaging is present
         self.assertIn("Pace Maker", panel_str)
@@ -204,9 +212,7 @@ class TestDisplayWeeklyLimit(unittest.TestCase):
         self.assertIsNotNone(panel)
 
         # Render panel to string
-        console = Console(file=StringIO(), force_terminal=True, width=120)
-        console.print(panel)
-        panel_str = console.file.getvalue()
+        panel_str = _render_to_str(panel)
 
         # Verify 5-hour section is present
         self.assertIn("5-Hour", panel_str)
@@ -28,6 +28,11 @@ def _make_event(event_type, project="proj", feedback="Rejected", ts=None):
     }
 
 
+def _plain(renderable):
+    """Plain text of a feed renderable, using Text.plain when available."""
+    return renderable.plain if hasattr(renderable, "plain") else str(renderable)
+
+
 class TestRenderEventFeedIconMapping:
     """Tests for event type icon mapping in render_event_feed."""
 
@@ -35,22 +40,21 @@ class TestRenderEventFeedIconMapping:
         """IV events render with cross icon."""
         events = [_make_event("IV")]
         result = renderer.render_event_feed(events, available_width=60)
-        # Convert to plain text for assertion
-        text = result.plain if hasattr(result, "plain") else str(result)
+        text = _plain(result)
         assert "\u2716" in text  # cross mark
 
     def test_td_icon(self, renderer):
         """TD events render with warning icon."""
         events = [_make_event("TD")]
         result = renderer.render_event_feed(events, available_width=60)
-        text = result.plain if hasattr(result, "plain") else str(result)
+        text = _plain(result)
         assert "\u26a0" in text  # warning sign
 
     def test_cc_icon(self, renderer):
         """CC events render with diamond icon."""
         events = [_make_event("CC")]
         result = renderer.render_event_feed(events, available_width=60)
-        text = result.plain if hasattr(result, "plain") else str(result)
+        text = _plain(result)
         assert "\u27e1" in text  # diamond
 
 
@@ -62,7 +66,7 @@ class TestRenderEventFeedTextWrapping:
         long_text = "This is a very long feedback message that should be wrapped " * 3
         events = [_make_event("IV", feedback=long_text)]
         result = renderer.render_event_feed(events, available_width=40)
-        text = result.plain if hasattr(result, "plain") else str(result)
+        text = _plain(result)
         lines = text.strip().split("\n")
         # Should have multiple lines for the wrapped text
         assert len(lines) > 2
@@ -83,7 +87,7 @@ class TestRenderEventFeedScrollOffset:
         result = renderer.render_event_feed(
             events, available_width=60, scroll_offset=1,
         )
-        text = result.plain if hasattr(result, "plain") else str(result)
+        text = _plain(result)
         assert "Event B" in text or "Event C" in text
 
 
@@ -93,8 +97,8 @@ class TestRenderEventFeedEmpty:
     def test_empty_events_returns_renderable(self, renderer):
         """Empty events list returns a valid renderable."""
         result = renderer.render_event_feed([], available_width=60)
-        text = result.plain if hasattr(result, "plain") else str(result)
-        assert "0 events" in text.lower() or "no events" in text.lower()
+        text = _plain(result).lower()
+        assert "0 events" in text or "no events" in text
 
     def test_footer_shows_event_count(self, renderer):
         """Footer shows total event count."""
@@ -104,5 +108,5 @@ class TestRenderEventFeedEmpty:
             _make_event("TD", feedback="Two", ts=now - 5),
         ]
         result = renderer.render_event_feed(events, available_width=60)
-        text = result.plain if hasattr(result, "plain") else str(result)
+        text = _plain(result)
         assert "2 events" in text.lower()
@@ -13,197 +13,97 @@ from rich.console import Console
 
 from claude_usage.code_mode.display import UsageRenderer
 
+# One console for the module; _render_plain resets its buffer per render.
+# No terminal and no colour, so Rich writes bare text without ANSI escapes
+# and the substring assertions only scan the visible characters.
+_CONSOLE = Console(file=StringIO(), width=80, no_color=True, color_system=None)
+
 
 class TestLangfuseDisplayIntegration(unittest.TestCase):
     """Test cases for Langfuse status and metrics display in bottom section"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.renderer = UsageRenderer()
-
-    def _render_to_text(self, group, width=80):
-        """Helper to render Rich Group to plain text"""
-        console = Console(file=StringIO(), width=width, force_terminal=True)
-        with console.capture() as capture:
-            console.print(group)
-        return capture.get()
-
-    def test_left_panel_shows_langfuse_on_when_enabled(self):
-        """Left panel should show 'Langfuse: on' when enabled"""
-        pacemaker_status = {
-            "enabled": True,
-            "has_data": True,
-
-            "tempo_enabled": True,
-            "subagent_reminder_enabled": True,
-            "intent_validation_enabled": False,
-            "langfuse_enabled": True,  # Langfuse enabled
-        }
-        blockage_stats = {"Intent Validation": 0, "Total": 0}
-
-        result = self.renderer.render_bottom_section(pacemaker_status, blockage_stats)
-
-        # Render Rich output to text for assertion
-        output = self._render_to_text(result)
-        self.assertIn("Langfuse:", output)
-        self.assertIn("on", output.lower())
-
-    def test_left_panel_shows_langfuse_off_when_disabled(self):
-        """Left panel should show 'Langfuse: off' when disabled"""
-        pacemaker_status = {
-            "enabled": True,
-            "has_data": True,
-
-            "tempo_enabled": True,
-            "subagent_reminder_enabled": True,
-            "intent_validation_enabled": False,
-            "langfuse_enabled": False,  # Langfuse disabled
-        }
-        blockage_stats = {"Intent Validation": 0, "Total": 0}
-
-        result = self.renderer.render_bottom_section(pacemaker_status, blockage_stats)
-
-        # Render Rich output to text for assertion
-        output = self._render_to_text(result)
-        self.assertIn("Langfuse:", output)
-        self.assertIn("off", output.lower())
-
-    def test_right_panel_shows_langfuse_metrics_when_available(self):
-        """Right panel should show Langfuse metrics when data is available"""
-        pacemaker_status = {
-            "enabled": True,
-            "has_data": True,
-
-            "tempo_enabled": True,
-            "subagent_reminder_enabled": True,
-            "intent_validation_enabled": False,
-            "langfuse_enabled": True,
-        }
-        blockage_stats = {"Intent Validation": 5, "Total": 10}
-        langfuse_metrics = {
-            "sessions": 123,
-            "traces": 456,
-            "spans": 789,
-            "total": 1368,
-        }
-
-        result = self.renderer.render_bottom_section(
-            pacemaker_status, blockage_stats, langfuse_metrics=langfuse_metrics
-        )
-
-        # Render Rich output to text for assertion
-        output = self._render_to_text(result)
-        self.assertIn("Langfuse", output)
-        self.assertIn("123", output)  # Sessions count
-        self.assertIn("456", output)  # Traces count
-        self.assertIn("789", output)  # Spans count
-        self.assertIn("1368", output)  # Total count
-
-    def test_right_panel_shows_langfuse_unavailable_when_none(self):
-        """Right panel should show 'unavailable' when metrics are None"""
-        pacemaker_status = {
-            "enabled": True,
-            "has_data": True,
-
-            "tempo_enabled": True,
-            "subagent_reminder_enabled": True,
-            "intent_validation_enabled": False,
-            "langfuse_enabled": True,
-        }
-        blockage_stats = {"Intent Validation": 5, "Total": 10}
-        langfuse_metrics = None  # No metrics available
-
-        result = self.renderer.render_bottom_section(
-            pacemaker_status, blockage_stats, langfuse_metrics=langfuse_metrics
-        )
-
-        # Render Rich output to text for assertion
-        output = self._render_to_text(result)
-        self.assertIn("Langfuse", output)
-        self.assertIn("unavailable", output.lower())
-
-    def test_right_panel_shows_langfuse_zeros_when_no_activity(self):
-        """Right panel should show zeros when no Langfuse activity in 24h"""
-        pacemaker_status = {
-            "enabled": True,
-            "has_data": True,
-
-            "tempo_enabled": True,
-            "subagent_reminder_enabled": True,
-            "intent_validation_enabled": False,
-            "langfuse_enabled": True,
-        }
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures - one stateless renderer for the class"""
+        cls.renderer = UsageRenderer()
+
+    def _render_plain(self, group):
+        """Helper to render Rich Group to plain text without ANSI escapes"""
+        buf = _CONSOLE.file
+        buf.seek(0)
+        buf.truncate(0)
+        _CONSOLE.print(group)
+        return buf.getvalue()
+
+    # (name, langfuse_enabled, langfuse_metrics, expected, forbidden)
+    # langfuse_enabled=None leaves the key out of pacemaker_status.
+    CASES = [
+        # Left panel: on/off status indicator
+        ("left_panel_on_when_enabled", True, None, ("Langfuse:", "on"), ()),
+        ("left_panel_off_when_disabled", False, None, ("Langfuse:", "off"), ()),
+        ("status_defaults_to_off_when_missing", None, None, ("Langfuse:", "off"), ()),
+        # Right panel: metrics with aligned labels
+        (
+            "right_panel_metrics_and_alignment",
+            True,
+            {"sessions": 123, "traces": 456, "spans": 789, "total": 1368},
+            (
+                "Langfuse",
+                "Sessions",
+                "123",
+                "Traces",
+                "456",
+                "Spans",
+                "789",
+                "Total",
+                "1368",
+            ),
+            (),
+        ),
+        ("right_panel_unavailable_when_none", True, None, ("unavailable",), ()),
+        # Zeros, not "unavailable", when no activity in 24h
+        (
+            "right_panel_zeros_when_no_activity",
+            True,
+            {"sessions": 0, "traces": 0, "spans": 0, "total": 0},
+            ("Langfuse",),
+            ("unavailable",),
+        ),
+    ]
+
+    def test_langfuse_rendering_matrix(self):
+        """Langfuse status and metrics render as expected for each input"""
         blockage_stats = {"Intent Validation": 0, "Total": 0}
-        langfuse_metrics = {
-            "sessions": 0,
-            "traces": 0,
-            "spans": 0,
-            "total": 0,
-        }
-
-        result = self.renderer.render_bottom_section(
-            pacemaker_status,
-            blockage_stats,
-            langfuse_metrics=langfuse_metrics,
-            secrets_metrics={"secrets_masked": 0, "secrets_stored": 0},
-        )
-
-        # Render Rich output to text for assertion
-        output = self._render_to_text(result)
-        self.assertIn("Langfuse", output)
-        # Should show zeros, not "unavailable"
-        self.assertNotIn("unavailable", output.lower())
-
-    def test_langfuse_status_defaults_to_off_when_not_in_pacemaker_status(self):
-        """Langfuse should default to 'off' when langfuse_enabled key is missing"""
-        pacemaker_status = {
-            "enabled": True,
-            "has_data": True,
-
-            "tempo_enabled": True,
-            "subagent_reminder_enabled": True,
-            "intent_validation_enabled": False,
-            # langfuse_enabled key missing
-        }
-        blockage_stats = {"Intent Validation": 0, "Total": 0}
-
-        result = self.renderer.render_bottom_section(pacemaker_status, blockage_stats)
-
-        # Render Rich output to text for assertion
-        output = self._render_to_text(result)
-        self.assertIn("Langfuse:", output)
-        self.assertIn("off", output.lower())
-
-    def test_langfuse_metrics_section_label_alignment(self):
-        """Langfuse metrics section should have properly aligned labels"""
-        pacemaker_status = {
-            "enabled": True,
-            "has_data": True,
-
-            "tempo_enabled": True,
-            "subagent_reminder_enabled": True,
-            "intent_validation_enabled": False,
-            "langfuse_enabled": True,
-        }
-        blockage_stats = {"Intent Validation": 5, "Total": 10}
-        langfuse_metrics = {
-            "sessions": 123,
-            "traces": 456,
-            "spans": 789,
-            "total": 1368,
-        }
-
-        result = self.renderer.render_bottom_section(
-            pacemaker_status, blockage_stats, langfuse_metrics=langfuse_metrics
-        )
-
-        # Render Rich output to text for assertion
-        output = self._render_to_text(result)
-        # Check that metric labels are present
-        self.assertIn("Sessions", output)
-        self.assertIn("Traces", output)
-        self.assertIn("Spans", output)
-        self.assertIn("Total", output)
+        # Secrets metrics present so any "unavailable" comes from Langfuse
+        secrets_metrics = {"secrets_masked": 0, "secrets_stored": 0}
+
+        for name, langfuse_enabled, metrics, expected, forbidden in self.CASES:
+            with self.subTest(case=name):
+                pacemaker_status = {
+                    "enabled": True,
+                    "has_data": True,
+                    "tempo_enabled": True,
+                    "subagent_reminder_enabled": True,
+                    "intent_validation_enabled": False,
+                }
+                if langfuse_enabled is not None:
+                    pacemaker_status["langfuse_enabled"] = langfuse_enabled
+
+                result = self.renderer.render_bottom_section(
+                    pacemaker_status,
+                    blockage_stats,
+                    langfuse_metrics=metrics,
+                    secrets_metrics=secrets_metrics,
+                )
+
+                output = self._render_plain(result)
+                lowered = output.lower()
+                # Lowercase words (on/off/unavailable) match case-insensitively,
+                # labels and counts exactly; forbidden words never in any case
+                for needle in expected:
+                    self.assertIn(needle, lowered if needle.islower() else output)
+                for needle in forbidden:
+                    self.assertNotIn(needle, lowered)
 
 
 if __name__ == "__main__":
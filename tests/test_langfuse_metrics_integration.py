@@ -14,6 +14,7 @@ import tempfile
 import time
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from claude_usage.code_mode.pacemaker_integration import PaceMakerReader
 
@@ -23,7 +24,8 @@ class TestLangfuseMetricsRetrieval(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures with temporary database"""
-        self.temp_dir = tempfile.mkdtemp()
+        self._tmp_ctx = tempfile.TemporaryDirectory()
+        self.temp_dir = self._tmp_ctx.name
         self.db_path = os.path.join(self.temp_dir, "usage.db")
         self.config_path = os.path.join(self.temp_dir, "config.json")
         self._initialize_test_database()
@@ -35,9 +37,8 @@ class TestLangfuseMetricsRetrieval(unittest.TestCase):
 
     def tearDown(self):
         """Clean up temporary files"""
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.reader.close()
+        self._tmp_ctx.cleanup()
 
     def _initialize_test_database(self):
         """Initialize test database with langfuse_metrics table"""
@@ -128,6 +129,17 @@ class TestLangfuseMetricsRetrieval(unittest.TestCase):
         self.assertEqual(metrics["spans"], 20)
         self.assertEqual(metrics["total"], 35)
 
+    def test_cutoff_is_whole_seconds_and_inclusive(self):
+        """A bucket exactly 24h before the current second is still counted"""
+        now = 1_700_000_000.75
+        self._insert_metric_bucket(int(now) - 86400, sessions=1)
+        self._insert_metric_bucket(int(now) - 86401, sessions=100)
+
+        with patch("time.time", return_value=now):
+            metrics = self.reader.get_langfuse_metrics()
+
+        self.assertEqual(metrics["sessions"], 1)
+
     def test_database_not_installed_returns_none(self):
         """When database doesn't exist, should return None"""
         self.reader.db_path = Path("/nonexistent/path/usage.db")
@@ -145,13 +157,119 @@ class TestLangfuseMetricsRetrieval(unittest.TestCase):
         metrics = self.reader.get_langfuse_metrics()
         self.assertIsNone(metrics)
 
+    def test_connection_is_reused_and_sees_new_rows(self):
+        """One read-only connection should serve every call and see new data"""
+        now = time.time()
+        self._insert_metric_bucket(int(now - 3600), sessions=1, traces=2, spans=3)
+        self.assertEqual(self.reader.get_langfuse_metrics()["total"], 6)
+        conn = self.reader._metrics_conn
+
+        self._insert_metric_bucket(int(now - 60), sessions=1, traces=1, spans=1)
+        self.assertEqual(self.reader.get_langfuse_metrics()["total"], 9)
+        self.assertIs(self.reader._metrics_conn, conn)
+
+    def test_connection_is_read_only(self):
+        """The metrics connection must not be able to write to usage.db"""
+        self.reader.get_langfuse_metrics()
+
+        with self.assertRaises(sqlite3.OperationalError):
+            self.reader._metrics_conn.execute("DELETE FROM langfuse_metrics")
+
+    def test_replaced_database_is_reopened(self):
+        """Replacing usage.db should open a new connection to the new file"""
+        self.reader.get_langfuse_metrics()
+        old_conn = self.reader._metrics_conn
+
+        os.remove(self.db_path)
+        self._initialize_test_database()
+        self._insert_metric_bucket(int(time.time() - 60), sessions=2)
+
+        metrics = self.reader.get_langfuse_metrics()
+        self.assertEqual(metrics["sessions"], 2)
+        self.assertIsNot(self.reader._metrics_conn, old_conn)
+
+    def test_close_releases_connection_and_next_read_reopens(self):
+        """close() is idempotent and a later read opens a fresh connection"""
+        self._insert_metric_bucket(int(time.time() - 60), sessions=1)
+        self.reader.get_langfuse_metrics()
+
+        self.reader.close()
+        self.reader.close()
+        self.assertIsNone(self.reader._metrics_conn)
+
+        self.assertEqual(self.reader.get_langfuse_metrics()["sessions"], 1)
+        self.assertIsNotNone(self.reader._metrics_conn)
+
+
+class TestSecretsMetricsRetrieval(unittest.TestCase):
+    """Test cases for get_secrets_metrics() on the shared read-only connection"""
+
+    def setUp(self):
+        """Set up test fixtures with a langfuse + secrets database"""
+        self._tmp_ctx = tempfile.TemporaryDirectory()
+        self.temp_dir = self._tmp_ctx.name
+        self.db_path = os.path.join(self.temp_dir, "usage.db")
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(
+            """
+            CREATE TABLE langfuse_metrics (
+                bucket_timestamp INTEGER PRIMARY KEY,
+                sessions_count INTEGER DEFAULT 0,
+                traces_count INTEGER DEFAULT 0,
+                spans_count INTEGER DEFAULT 0
+            );
+            CREATE TABLE secrets_metrics (
+                bucket_timestamp INTEGER PRIMARY KEY,
+                secrets_masked_count INTEGER DEFAULT 0
+            );
+            CREATE TABLE secrets (id INTEGER PRIMARY KEY, value TEXT);
+            """
+        )
+        now = int(time.time())
+        conn.executemany(
+            "INSERT INTO secrets_metrics VALUES (?, ?)",
+            [(now - 60, 2), (now - 3600, 3), (now - 86401, 100)],
+        )
+        conn.executemany("INSERT INTO secrets (value) VALUES (?)", [("a",), ("b",)])
+        conn.commit()
+        conn.close()
+        self.reader = PaceMakerReader()
+        self.reader.pm_dir = Path(self.temp_dir)
+        self.reader.db_path = Path(self.db_path)
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        self.reader.close()
+        self._tmp_ctx.cleanup()
+
+    def test_secrets_metrics_within_24h(self):
+        """Masked counts are summed over 24h and stored secrets are counted"""
+        metrics = self.reader.get_secrets_metrics()
+        self.assertEqual(metrics, {"secrets_masked": 5, "secrets_stored": 2})
+
+    def test_metrics_readers_share_one_read_only_connection(self):
+        """Langfuse and secrets metrics should reuse the same connection"""
+        self.reader.get_langfuse_metrics()
+        conn = self.reader._metrics_conn
+        self.reader.get_secrets_metrics()
+
+        self.assertIs(self.reader._metrics_conn, conn)
+        with self.assertRaises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM secrets")
+
+    def test_database_not_installed_returns_none(self):
+        """When database doesn't exist, should return None"""
+        self.reader.db_path = Path("/nonexistent/path/usage.db")
+        self.assertIsNone(self.reader.get_secrets_metrics())
+
 
 class TestLangfuseStatusRetrieval(unittest.TestCase):
     """Test cases for get_langfuse_status() method"""
 
     def setUp(self):
         """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
+        self._tmp_ctx = tempfile.TemporaryDirectory()
+        self.temp_dir = self._tmp_ctx.name
         self.config_path = os.path.join(self.temp_dir, "config.json")
         self.reader = PaceMakerReader()
         self.reader.pm_dir = Path(self.temp_dir)
@@ -159,9 +277,7 @@ class TestLangfuseStatusRetrieval(unittest.TestCase):
 
     def tearDown(self):
         """Clean up temporary files"""
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self._tmp_ctx.cleanup()
 
     def _create_config(
         self,
@@ -179,57 +295,93 @@ class TestLangfuseStatusRetrieval(unittest.TestCase):
         with open(self.config_path, "w") as f:
             json.dump(config, f)
 
-    def test_langfuse_disabled_returns_false(self):
-        """When langfuse_enabled is False, should return False"""
-        self._create_config(langfuse_enabled=False)
+    def test_langfuse_status_matrix(self):
+        """Status is True only when enabled with non-blank public and secret keys"""
+        # (case, langfuse_enabled, public_key, secret_key, expected)
+        cases = [
+            ("disabled", False, "", "", False),
+            ("enabled_with_keys", True, "pk-lf-test-123", "sk-lf-test-456", True),
+            ("enabled_without_public_key", True, "", "sk-lf-test-456", False),
+            ("enabled_without_secret_key", True, "pk-lf-test-123", "", False),
+            ("whitespace_only_keys", True, "   ", "   ", False),
+        ]
+        for case, langfuse_enabled, public_key, secret_key, expected in cases:
+            with self.subTest(case=case):
+                self._create_config(
+                    langfuse_enabled=langfuse_enabled,
+                    public_key=public_key,
+                    secret_key=secret_key,
+                )
+                self.assertEqual(self.reader.get_langfuse_status(), expected)
+
+    def test_config_not_installed_returns_false(self):
+        """When config file doesn't exist, should return False"""
+        self.reader.config_path = Path("/nonexistent/path/config.json")
         status = self.reader.get_langfuse_status()
         self.assertFalse(status)
 
-    def test_langfuse_enabled_with_keys_returns_true(self):
-        """When langfuse_enabled is True and keys are present, should return True"""
+    def test_unchanged_config_is_not_reparsed(self):
+        """Repeated status checks should reuse the parsed config"""
         self._create_config(
             langfuse_enabled=True,
             public_key="pk-lf-test-123",
             secret_key="sk-lf-test-456",
         )
-        status = self.reader.get_langfuse_status()
-        self.assertTrue(status)
+        # Age the file past the settle window so the cache may be trusted
+        old_ns = time.time_ns() - 10 * 1_000_000_000
+        os.utime(self.config_path, ns=(old_ns, old_ns))
+        self.assertTrue(self.reader.get_langfuse_status())
+
+        with patch(
+            "claude_usage.code_mode.pacemaker_integration.json.load"
+        ) as mock_load:
+            self.assertTrue(self.reader.get_langfuse_status())
+        mock_load.assert_not_called()
+
+    def test_changed_config_is_reread(self):
+        """Rewriting config.json should be picked up on the next check"""
+        self._create_config(
+            langfuse_enabled=True,
+            public_key="pk-lf-test-123",
+            secret_key="sk-lf-test-456",
+        )
+        self.assertTrue(self.reader.get_langfuse_status())
 
-    def test_langfuse_enabled_without_public_key_returns_false(self):
-        """When public_key is missing, should return False even if enabled"""
+        self._create_config(langfuse_enabled=False)
+        self.assertFalse(self.reader.get_langfuse_status())
+
+    def test_same_size_rewrite_within_mtime_tick_is_reread(self):
+        """A same-size rewrite that keeps the old mtime must not be cached"""
         self._create_config(
             langfuse_enabled=True,
-            public_key="",
+            public_key="pk-lf-test-123",
             secret_key="sk-lf-test-456",
         )
-        status = self.reader.get_langfuse_status()
-        self.assertFalse(status)
+        first = os.stat(self.config_path)
+        self.assertTrue(self.reader.get_langfuse_status())
 
-    def test_langfuse_enabled_without_secret_key_returns_false(self):
-        """When secret_key is missing, should return False even if enabled"""
+        # Same size, blank secret key, and the mtime of the first write
         self._create_config(
             langfuse_enabled=True,
             public_key="pk-lf-test-123",
-            secret_key="",
+            secret_key=" " * len("sk-lf-test-456"),
         )
-        status = self.reader.get_langfuse_status()
-        self.assertFalse(status)
+        os.utime(self.config_path, ns=(first.st_atime_ns, first.st_mtime_ns))
+        self.assertEqual(os.stat(self.config_path).st_size, first.st_size)
 
-    def test_config_not_installed_returns_false(self):
-        """When config file doesn't exist, should return False"""
-        self.reader.config_path = Path("/nonexistent/path/config.json")
-        status = self.reader.get_langfuse_status()
-        self.assertFalse(status)
+        self.assertFalse(self.reader.get_langfuse_status())
 
-    def test_whitespace_only_keys_returns_false(self):
-        """When keys are whitespace-only, should return False"""
+    def test_removed_config_returns_false_after_cache(self):
+        """Deleting config.json should not leave a stale cached status"""
         self._create_config(
             langfuse_enabled=True,
-            public_key="   ",
-            secret_key="   ",
+            public_key="pk-lf-test-123",
+            secret_key="sk-lf-test-456",
         )
-        status = self.reader.get_langfuse_status()
-        self.assertFalse(status)
+        self.assertTrue(self.reader.get_langfuse_status())
+
+        os.remove(self.config_path)
+        self.assertFalse(self.reader.get_langfuse_status())
 
 
 if __name__ == "__main__":
@@ -13,14 +13,13 @@ class TestMainE2E(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
+        self._tmp_ctx = tempfile.TemporaryDirectory()
+        self.temp_dir = self._tmp_ctx.name
         self.credentials_path = Path(self.temp_dir) / ".credentials.json"
 
     def tearDown(self):
         """Clean up test fixtures"""
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self._tmp_ctx.cleanup()
 
     def test_main_calls_parse_args_on_startup(self):
         """Test that main() calls parse_args() to get CLI arguments"""
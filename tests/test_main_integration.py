@@ -14,14 +14,13 @@ class TestModeResolution(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
+        self._tmp_ctx = tempfile.TemporaryDirectory()
+        self.temp_dir = self._tmp_ctx.name
         self.credentials_path = Path(self.temp_dir) / ".credentials.json"
 
     def tearDown(self):
         """Clean up test fixtures"""
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self._tmp_ctx.cleanup()
 
     def test_resolve_mode_uses_cli_override_when_provided(self):
         """Test that CLI --mode argument overrides auto-detection"""
@@ -2,8 +2,6 @@
 
 import pytest
 import json
-import tempfile
-from pathlib import Path
 from unittest.mock import patch
 from claude_usage.monitor import ClaudeUsageMonitor
 
@@ -11,17 +9,15 @@ from claude_usage.monitor import ClaudeUsageMonitor
 class TestConsoleMonitorIntegration:
     """Integration tests for Console mode full workflow"""
 
-    @pytest.fixture
-    def console_credentials_file(self):
-        """Create temporary credentials file with Admin API key"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-            credentials = {
-                "anthropicConsole": {"adminApiKey": "sk-ant-REDACTED"}
-            }
-            json.dump(credentials, f)
-            path = Path(f.name)
-        yield path
-        path.unlink()
+    @pytest.fixture(scope="module")
+    def console_credentials_file(self, tmp_path_factory):
+        """Create the credentials file with Admin API key, shared by the module"""
+        path = tmp_path_factory.mktemp("console") / "creds.json"
+        credentials = {
+            "anthropicConsole": {"adminApiKey": "sk-ant-REDACTED"}
+        }
+        path.write_text(json.dumps(credentials))
+        return path
 
     def test_console_mode_initialization_creates_console_components(
         self, console_credentials_file
@@ -9,249 +9,115 @@ get_langfuse_status() or get_langfuse_metrics(), causing display to always
 show "off" and "unavailable".
 """
 
-import unittest
-from unittest.mock import MagicMock, patch
+import pytest
+from unittest.mock import MagicMock, NonCallableMagicMock, patch
 from pathlib import Path
 
+from claude_usage.code_mode.display import UsageRenderer
 from claude_usage.code_mode.monitor import CodeMonitor
-
-
-class TestMonitorLangfuseIntegration(unittest.TestCase):
+from claude_usage.code_mode.pacemaker_integration import PaceMakerReader
+
+# Tests are independent and safe to run under pytest-xdist (-n auto); the
+# class-scoped patches are started separately in each worker process
+pytestmark = pytest.mark.integration
+
+CREDENTIALS_PATH = Path("/tmp/test_credentials.json")
+
+# pace-maker status every test starts from; tests override single fields
+DEFAULT_STATUS = {
+    "enabled": True,
+    "has_data": True,
+}
+
+# Langfuse metrics the reader reports when a test needs data to be present
+DEFAULT_METRICS = {"sessions": 10, "traces": 20, "spans": 30, "total": 60}
+
+
+@pytest.fixture(scope="class")
+def patched_monitor_deps():
+    """Patch CodeMonitor's PaceMakerReader and UsageRenderer once per class
+
+    The instances are spec_set to the real classes, so only attributes that
+    exist on them can be read or set. The monitor never calls its renderer
+    instance, so that one is non-callable.
+    """
+    reader_patcher = patch("claude_usage.code_mode.monitor.PaceMakerReader")
+    renderer_patcher = patch("claude_usage.code_mode.monitor.UsageRenderer")
+    mock_reader_class = reader_patcher.start()
+    mock_renderer_class = renderer_patcher.start()
+    mock_reader_class.return_value = MagicMock(spec_set=PaceMakerReader)
+    mock_renderer_class.return_value = NonCallableMagicMock(spec_set=UsageRenderer)
+    yield mock_reader_class, mock_renderer_class
+    renderer_patcher.stop()
+    reader_patcher.stop()
+
+
+@pytest.fixture
+def monitor_deps(patched_monitor_deps):
+    """Reset the shared reader/renderer mocks to an installed pace-maker"""
+    mock_reader_class, mock_renderer_class = patched_monitor_deps
+    mock_reader = mock_reader_class.return_value
+    mock_renderer = mock_renderer_class.return_value
+    mock_reader.reset_mock(return_value=True, side_effect=True)
+    mock_renderer.reset_mock(return_value=True, side_effect=True)
+
+    mock_reader.is_installed.return_value = True
+    mock_reader.get_status.return_value = dict(DEFAULT_STATUS)
+    mock_reader.get_langfuse_status.return_value = True
+    mock_reader.get_langfuse_metrics.return_value = None
+    return mock_reader, mock_renderer
+
+
+class TestMonitorLangfuseIntegration:
     """Test CodeMonitor fetches and passes Langfuse data correctly"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.credentials_path = Path("/tmp/test_credentials.json")
-
-    @patch("claude_usage.code_mode.monitor.PaceMakerReader")
-    @patch("claude_usage.code_mode.monitor.UsageRenderer")
-    def test_get_display_fetches_langfuse_status_when_pacemaker_installed(
-        self, mock_renderer_class, mock_reader_class
+    @pytest.mark.parametrize(
+        "is_installed,lf_status,lf_metrics",
+        [
+            # CRITICAL-1a/b: status and metrics are fetched when installed
+            pytest.param(True, True, DEFAULT_METRICS, id="enabled-with-metrics"),
+            # CRITICAL-1c: langfuse_enabled is injected into pacemaker_status
+            pytest.param(True, True, None, id="enabled-no-metrics"),
+            # CRITICAL-1d: metrics reach render_bottom_section as a kwarg
+            pytest.param(
+                True,
+                False,
+                {"sessions": 123, "traces": 456, "spans": 789, "total": 1368},
+                id="disabled-with-metrics",
+            ),
+            # No metrics available: None is passed through to the renderer
+            pytest.param(True, False, None, id="disabled-no-metrics"),
+            # Pace-maker not installed: Langfuse is never queried
+            pytest.param(False, True, DEFAULT_METRICS, id="not-installed"),
+        ],
+    )
+    def test_get_display_langfuse_data(
+        self, monitor_deps, is_installed, lf_status, lf_metrics
     ):
-        """CRITICAL-1a: get_display() should call get_langfuse_status() when pace-maker installed"""
-        # Setup mock PaceMakerReader
-        mock_reader = MagicMock()
-        mock_reader.is_installed.return_value = True
-        mock_reader.get_status.return_value = {
-            "enabled": True,
-            "has_data": True,
+        """get_display() fetches Langfuse data and hands it to the renderer"""
+        mock_reader, mock_renderer = monitor_deps
+        mock_reader.is_installed.return_value = is_installed
+        mock_reader.get_langfuse_status.return_value = lf_status
+        mock_reader.get_langfuse_metrics.return_value = lf_metrics
 
-        }
-        mock_reader.get_langfuse_status.return_value = True  # Langfuse enabled
-        mock_reader.get_langfuse_metrics.return_value = {
-            "sessions": 10,
-            "traces": 20,
-            "spans": 30,
-            "total": 60,
-        }
-        mock_reader_class.return_value = mock_reader
-
-        # Setup mock renderer
-        mock_renderer = MagicMock()
-        mock_renderer.render.return_value = MagicMock()
-        mock_renderer.render_bottom_section.return_value = MagicMock()
-        mock_renderer_class.return_value = mock_renderer
-
-        # Create monitor and call get_display()
-        monitor = CodeMonitor(self.credentials_path)
+        monitor = CodeMonitor(CREDENTIALS_PATH)
         monitor.get_display()
 
-        # ASSERT: get_langfuse_status() should be called
-        mock_reader.get_langfuse_status.assert_called_once()
-
-    @patch("claude_usage.code_mode.monitor.PaceMakerReader")
-    @patch("claude_usage.code_mode.monitor.UsageRenderer")
-    def test_get_display_fetches_langfuse_metrics_when_pacemaker_installed(
-        self, mock_renderer_class, mock_reader_class
-    ):
-        """CRITICAL-1b: get_display() should call get_langfuse_metrics() when pace-maker installed"""
-        # Setup mock PaceMakerReader
-        mock_reader = MagicMock()
-        mock_reader.is_installed.return_value = True
-        mock_reader.get_status.return_value = {
-            "enabled": True,
-            "has_data": True,
-
-        }
-        mock_reader.get_langfuse_status.return_value = True
-        mock_reader.get_langfuse_metrics.return_value = {
-            "sessions": 10,
-            "traces": 20,
-            "spans": 30,
-            "total": 60,
-        }
-        mock_reader_class.return_value = mock_reader
-
-        # Setup mock renderer
-        mock_renderer = MagicMock()
-        mock_renderer.render.return_value = MagicMock()
-        mock_renderer.render_bottom_section.return_value = MagicMock()
-        mock_renderer_class.return_value = mock_renderer
-
-        # Create monitor and call get_display()
-        monitor = CodeMonitor(self.credentials_path)
-        monitor.get_display()
+        if not is_installed:
+            assert mock_reader.get_langfuse_status.call_count == 0
+            assert mock_reader.get_langfuse_metrics.call_count == 0
+            return
 
-        # ASSERT: get_langfuse_metrics() should be called
-        mock_reader.get_langfuse_metrics.assert_called_once()
+        assert mock_reader.get_langfuse_status.call_count == 1
+        assert mock_reader.get_langfuse_metrics.call_count == 1
 
-    @patch("claude_usage.code_mode.monitor.PaceMakerReader")
-    @patch("claude_usage.code_mode.monitor.UsageRenderer")
-    def test_get_display_injects_langfuse_enabled_into_pacemaker_status(
-        self, mock_renderer_class, mock_reader_class
-    ):
-        """CRITICAL-1c: get_display() should inject langfuse_enabled into pacemaker_status dict"""
-        # Setup mock PaceMakerReader
-        mock_reader = MagicMock()
-        mock_reader.is_installed.return_value = True
-        mock_reader.get_status.return_value = {
-            "enabled": True,
-            "has_data": True,
-
-        }
-        mock_reader.get_langfuse_status.return_value = True  # Langfuse enabled
-        mock_reader.get_langfuse_metrics.return_value = None
-        mock_reader_class.return_value = mock_reader
-
-        # Setup mock renderer
-        mock_renderer = MagicMock()
-        mock_renderer.render.return_value = MagicMock()
-        mock_renderer.render_bottom_section.return_value = MagicMock()
-        mock_renderer_class.return_value = mock_renderer
-
-        # Create monitor and call get_display()
-        monitor = CodeMonitor(self.credentials_path)
-        monitor.get_display()
-
-        # ASSERT: render_bottom_section() should be called with langfuse_enabled=True in pacemaker_status
-        # First verify the method was called
-        mock_renderer.render_bottom_section.assert_called()
-
-        # Now safely access call arguments
+        # call_args is None until render_bottom_section() has been called
         call_args = mock_renderer.render_bottom_section.call_args
-        pacemaker_status_arg = call_args[0][0]  # First positional arg
-        self.assertIn(
-            "langfuse_enabled",
-            pacemaker_status_arg,
-            "pacemaker_status should contain langfuse_enabled key",
-        )
-        self.assertTrue(
-            pacemaker_status_arg["langfuse_enabled"],
-            "langfuse_enabled should be True",
-        )
-
-    @patch("claude_usage.code_mode.monitor.PaceMakerReader")
-    @patch("claude_usage.code_mode.monitor.UsageRenderer")
-    def test_get_display_passes_langfuse_metrics_to_render_bottom_section(
-        self, mock_renderer_class, mock_reader_class
-    ):
-        """CRITICAL-1d: get_display() should pass langfuse_metrics parameter to render_bottom_section()"""
-        # Setup mock PaceMakerReader
-        mock_reader = MagicMock()
-        mock_reader.is_installed.return_value = True
-        mock_reader.get_status.return_value = {
-            "enabled": True,
-            "has_data": True,
-
-        }
-        mock_reader.get_langfuse_status.return_value = False
-        expected_metrics = {
-            "sessions": 123,
-            "traces": 456,
-            "spans": 789,
-            "total": 1368,
-        }
-        mock_reader.get_langfuse_metrics.return_value = expected_metrics
-        mock_reader_class.return_value = mock_reader
-
-        # Setup mock renderer
-        mock_renderer = MagicMock()
-        mock_renderer.render.return_value = MagicMock()
-        mock_renderer.render_bottom_section.return_value = MagicMock()
-        mock_renderer_class.return_value = mock_renderer
-
-        # Create monitor and call get_display()
-        monitor = CodeMonitor(self.credentials_path)
-        monitor.get_display()
-
-        # ASSERT: render_bottom_section() should be called with langfuse_metrics kwarg
-        # First verify the method was called
-        mock_renderer.render_bottom_section.assert_called()
-
-        # Now safely access call kwargs
-        call_kwargs = mock_renderer.render_bottom_section.call_args.kwargs
-        self.assertIn(
-            "langfuse_metrics",
-            call_kwargs,
-            "render_bottom_section should receive langfuse_metrics keyword argument",
-        )
-        self.assertEqual(
-            call_kwargs["langfuse_metrics"],
-            expected_metrics,
-            "langfuse_metrics should match what get_langfuse_metrics() returned",
-        )
-
-    @patch("claude_usage.code_mode.monitor.PaceMakerReader")
-    @patch("claude_usage.code_mode.monitor.UsageRenderer")
-    def test_get_display_skips_langfuse_when_pacemaker_not_installed(
-        self, mock_renderer_class, mock_reader_class
-    ):
-        """When pace-maker not installed, Langfuse methods should not be called"""
-        # Setup mock PaceMakerReader - NOT installed
-        mock_reader = MagicMock()
-        mock_reader.is_installed.return_value = False
-        mock_reader_class.return_value = mock_reader
-
-        # Setup mock renderer
-        mock_renderer = MagicMock()
-        mock_renderer.render.return_value = MagicMock()
-        mock_renderer_class.return_value = mock_renderer
-
-        # Create monitor and call get_display()
-        monitor = CodeMonitor(self.credentials_path)
-        monitor.get_display()
-
-        # ASSERT: Langfuse methods should NOT be called
-        mock_reader.get_langfuse_status.assert_not_called()
-        mock_reader.get_langfuse_metrics.assert_not_called()
-
-    @patch("claude_usage.code_mode.monitor.PaceMakerReader")
-    @patch("claude_usage.code_mode.monitor.UsageRenderer")
-    def test_get_display_handles_none_langfuse_metrics_gracefully(
-        self, mock_renderer_class, mock_reader_class
-    ):
-        """When get_langfuse_metrics() returns None, should pass None to renderer"""
-        # Setup mock PaceMakerReader
-        mock_reader = MagicMock()
-        mock_reader.is_installed.return_value = True
-        mock_reader.get_status.return_value = {
-            "enabled": True,
-            "has_data": True,
-
-        }
-        mock_reader.get_langfuse_status.return_value = False
-        mock_reader.get_langfuse_metrics.return_value = None  # No metrics available
-        mock_reader_class.return_value = mock_reader
-
-        # Setup mock renderer
-        mock_renderer = MagicMock()
-        mock_renderer.render.return_value = MagicMock()
-        mock_renderer.render_bottom_section.return_value = MagicMock()
-        mock_renderer_class.return_value = mock_renderer
-
-        # Create monitor and call get_display()
-        monitor = CodeMonitor(self.credentials_path)
-        monitor.get_display()
-
-        # ASSERT: render_bottom_section() should receive langfuse_metrics=None
-        # First verify the method was called
-        mock_renderer.render_bottom_section.assert_called()
-
-        # Now safely access call kwargs
-        call_kwargs = mock_renderer.render_bottom_section.call_args.kwargs
-        self.assertIn("langfuse_metrics", call_kwargs)
-        self.assertIsNone(call_kwargs["langfuse_metrics"])
-
-
-if __name__ == "__main__":
-    unittest.main()
+        assert call_args is not None, "render_bottom_section not called"
+        pacemaker_status_arg = call_args.args[0]
+        assert (
+            pacemaker_status_arg["langfuse_enabled"] is lf_status
+        ), "pacemaker_status should carry get_langfuse_status() as langfuse_enabled"
+        assert (
+            call_args.kwargs["langfuse_metrics"] == lf_metrics
+        ), "langfuse_metrics should match what get_langfuse_metrics() returned"
@@ -1,234 +1,165 @@
 """Tests for ClaudeUsageMonitor mode detection and CLI integration"""
 
-import unittest
-import os
 import json
-import tempfile
+import pytest
 from pathlib import Path
 from unittest.mock import patch
 from claude_usage.monitor import ClaudeUsageMonitor, detect_mode
 
+# Tests are independent and safe to run under pytest-xdist (-n auto); the
+# shared directories come from tmp_path_factory, which is per worker
+pytestmark = pytest.mark.integration
+
 # Clearly fake, non-credential-looking placeholders for test data
 FAKE_PRIMARY_KEY = "fake-primary-api-key-for-testing"
 FAKE_OAUTH_TOKEN = "fake-oauth-access-token"
 FAKE_OAUTH_REFRESH = "fake-oauth-refresh-token"
 FAKE_OAUTH_EXPIRES_AT = 9999999999000
 
-
-class TestModeDetection(unittest.TestCase):
+ADMIN_KEY = "sk-ant-admin-test-key"
+
+# Never read: credentials are handed to detect_mode through credentials_provider
+CREDENTIALS_PATH = Path("/nonexistent/.credentials.json")
+
+_AI_OAUTH = {
+    "accessToken": FAKE_OAUTH_TOKEN,
+    "refreshToken": FAKE_OAUTH_REFRESH,
+    "expiresAt": FAKE_OAUTH_EXPIRES_AT,
+}
+_CODE_OAUTH = {"accessToken": "test-token", "refreshToken": "test-refresh"}
+_ADMIN_CONSOLE = {"adminApiKey": ADMIN_KEY}
+_OAUTH_CRED = {"claudeCode": _CODE_OAUTH}
+_OAUTH_PLUS_ADMIN = {**_OAUTH_CRED, "anthropicConsole": _ADMIN_CONSOLE}
+
+# Parsed credentials file contents, served by credentials_provider
+CRED_PAYLOADS = {
+    "empty": {},
+    "mcp_only": {"mcpOAuth": {"token": "irrelevant-mcp-token"}},
+    "ai_oauth": {"claudeAiOauth": _AI_OAUTH},
+    "oauth_only": _OAUTH_CRED,
+    "oauth+admin": _OAUTH_PLUS_ADMIN,
+    "admin_only": {"anthropicConsole": _ADMIN_CONSOLE},
+    "mode_console": {
+        "mode": "console",
+        "claudeAiOauth": _AI_OAUTH,
+        "anthropicConsole": _ADMIN_CONSOLE,
+    },
+    "mode_code": {
+        "mode": "code",
+        "claudeAiOauth": _AI_OAUTH,
+        "anthropicConsole": _ADMIN_CONSOLE,
+    },
+}
+
+# ~/.claude.json contents, one fake home directory per payload
+CLAUDE_JSON_PAYLOADS = {
+    "primary_key": json.dumps({"primaryApiKey": FAKE_PRIMARY_KEY}).encode(),
+    "no_key": json.dumps({"someOtherField": "no-key-here"}).encode(),
+}
+
+
+@pytest.fixture(scope="class")
+def tmp_root(tmp_path_factory):
+    """Directory shared by every test in the class"""
+    return tmp_path_factory.mktemp("creds")
+
+
+@pytest.fixture(scope="class")
+def fake_homes(tmp_root):
+    """Fake home directories keyed by their ~/.claude.json payload
+
+    The "empty" home has no ~/.claude.json at all.
+    """
+    homes = {"empty": tmp_root / "home-empty"}
+    homes["empty"].mkdir()
+    for key, payload in CLAUDE_JSON_PAYLOADS.items():
+        home = tmp_root / f"home-{key}"
+        home.mkdir()
+        (home / ".claude.json").write_bytes(payload)
+        homes[key] = home
+    return homes
+
+
+def _provider(payload_key):
+    """credentials_provider returning the named payload without any file I/O"""
+    return lambda: CRED_PAYLOADS[payload_key]
+
+
+@pytest.fixture(scope="class")
+def monitor():
+    """One ClaudeUsageMonitor per class; tests re-run detection via _reinit"""
+    return ClaudeUsageMonitor(
+        credentials_path=CREDENTIALS_PATH,
+        credentials_provider=_provider("oauth_only"),
+    )
+
+
+def _set_admin_key_env(monkeypatch, admin_key):
+    """Set or remove ANTHROPIC_ADMIN_API_KEY for the duration of the test"""
+    if admin_key is None:
+        monkeypatch.delenv("ANTHROPIC_ADMIN_API_KEY", raising=False)
+    else:
+        monkeypatch.setenv("ANTHROPIC_ADMIN_API_KEY", admin_key)
+
+
+class TestModeDetection:
     """Test cases for mode detection logic"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.credentials_path = Path(self.temp_dir) / ".credentials.json"
-        self.fake_home = Path(self.temp_dir) / "home"
-        self.fake_home.mkdir()
-
-    def tearDown(self):
-        """Clean up test fixtures"""
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def _detect_mode_with_fake_home(self, credentials_path, home_path):
-        """Run detect_mode with only Path.home() patched to home_path."""
-        with patch.dict(os.environ, {}, clear=True):
-            with patch("claude_usage.monitor.Path.home", return_value=home_path):
-                return detect_mode(credentials_path)
-
-    def _write_claude_json(self, home_path, data):
-        """Write fake ~/.claude.json into home_path directory."""
-        claude_json = home_path / ".claude.json"
-        with open(claude_json, "w") as f:
-            json.dump(data, f)
-
-    def test_detect_mode_console_when_claude_json_has_primary_api_key(self):
-        """Console mode detected via ~/.claude.json primaryApiKey
-        when credentials has only unrelated keys (e.g. mcpOAuth)"""
-        credentials_data = {"mcpOAuth": {"token": "irrelevant-mcp-token"}}
-        with open(self.credentials_path, "w") as f:
-            json.dump(credentials_data, f)
-
-        self._write_claude_json(self.fake_home, {"primaryApiKey": FAKE_PRIMARY_KEY})
-
-        mode, error = self._detect_mode_with_fake_home(self.credentials_path, self.fake_home)
-
-        self.assertEqual(mode, "console")
-        self.assertIsNone(error)
-
-    def test_detect_mode_code_when_oauth_in_credentials_overrides_claude_json_primary_key(self):
-        """OAuth in credentials returns code mode even when ~/.claude.json has primaryApiKey"""
-        credentials_data = {
-            "claudeAiOauth": {
-                "accessToken": FAKE_OAUTH_TOKEN,
-                "refreshToken": FAKE_OAUTH_REFRESH,
-                "expiresAt": FAKE_OAUTH_EXPIRES_AT,
-            }
-        }
-        with open(self.credentials_path, "w") as f:
-            json.dump(credentials_data, f)
-
-        self._write_claude_json(self.fake_home, {"primaryApiKey": FAKE_PRIMARY_KEY})
-
-        mode, error = self._detect_mode_with_fake_home(self.credentials_path, self.fake_home)
-
-        self.assertEqual(mode, "code")
-        self.assertIsNone(error)
-
-    def test_detect_mode_no_credentials_regression(self):
-        """Regression guard: no useful credentials anywhere returns exactly (None, 'No credentials found')"""
-        credentials_data = {"mcpOAuth": {"token": "irrelevant-mcp-token"}}
-        with open(self.credentials_path, "w") as f:
-            json.dump(credentials_data, f)
-
-        self._write_claude_json(self.fake_home, {"someOtherField": "no-key-here"})
-
-        result = self._detect_mode_with_fake_home(self.credentials_path, self.fake_home)
-
-        self.assertEqual(result, (None, "No credentials found"))
-
-    def test_detect_mode_code_when_oauth_available_despite_admin_key_in_env(self):
-        """Test that mode is 'code' when OAuth credentials take priority over env var"""
-        # Create credentials file with OAuth but no admin key
-        credentials_data = {
-            "claudeCode": {"accessToken": "test-token", "refreshToken": "test-refresh"}
-        }
-        with open(self.credentials_path, "w") as f:
-            json.dump(credentials_data, f)
-
-        with patch.dict(
-            os.environ, {"ANTHROPIC_ADMIN_API_KEY": "sk-ant-admin-test-key"}
-        ):
-            monitor = ClaudeUsageMonitor(credentials_path=self.credentials_path)
-            mode = monitor.detect_mode()
-
-            # Code mode takes priority over environment variable
-            self.assertEqual(mode, "code")
-
-    def test_detect_mode_code_when_oauth_available_despite_admin_key_in_file(self):
-        """Test that mode is 'code' when OAuth credentials take priority over admin key in file"""
-        credentials_data = {
-            "claudeCode": {"accessToken": "test-token", "refreshToken": "test-refresh"},
-            "anthropicConsole": {"adminApiKey": "sk-ant-admin-test-key"},
-        }
-        with open(self.credentials_path, "w") as f:
-            json.dump(credentials_data, f)
-
-        # Ensure env var is not set
-        with patch.dict(os.environ, {}, clear=True):
-            monitor = ClaudeUsageMonitor(credentials_path=self.credentials_path)
-            mode = monitor.detect_mode()
-
-            # Code mode takes priority over admin key in file
-            self.assertEqual(mode, "code")
-
-    def test_detect_mode_code_when_only_oauth_available(self):
-        """Test that mode is 'code' when only OAuth credentials available"""
-        credentials_data = {
-            "claudeCode": {"accessToken": "test-token", "refreshToken": "test-refresh"}
-        }
-        with open(self.credentials_path, "w") as f:
-            json.dump(credentials_data, f)
-
-        # Ensure env var is not set
-        with patch.dict(os.environ, {}, clear=True):
-            monitor = ClaudeUsageMonitor(credentials_path=self.credentials_path)
-            mode = monitor.detect_mode()
-
-            self.assertEqual(mode, "code")
-
-    def test_detect_mode_console_when_only_admin_key_in_file(self):
-        """Test that mode is 'console' when only admin key in file (no OAuth)"""
-        credentials_data = {
-            "anthropicConsole": {"adminApiKey": "sk-ant-admin-test-key"},
-        }
-        with open(self.credentials_path, "w") as f:
-            json.dump(credentials_data, f)
-
-        with patch.dict(os.environ, {}, clear=True):
-            monitor = ClaudeUsageMonitor(credentials_path=self.credentials_path)
-            mode = monitor.detect_mode()
-
-            self.assertEqual(mode, "console")
-
-    def test_detect_mode_console_when_only_admin_key_in_env(self):
-        """Test that mode is 'console' when only admin key in env (no OAuth)"""
-        # Don't create credentials file with OAuth
-        credentials_data = {}
-        with open(self.credentials_path, "w") as f:
-            json.dump(credentials_data, f)
-
-        with patch.dict(
-            os.environ, {"ANTHROPIC_ADMIN_API_KEY": "sk-ant-admin-test-key"}
-        ):
-            monitor = ClaudeUsageMonitor(credentials_path=self.credentials_path)
-            mode = monitor.detect_mode()
-
-            self.assertEqual(mode, "console")
-
-    def test_detect_mode_error_when_no_credentials(self):
+    @pytest.mark.parametrize(
+        "payload_key,home_key,expected",
+        [
+            # primaryApiKey is used when credentials only has unrelated keys
+            ("mcp_only", "primary_key", ("console", None)),
+            # OAuth in credentials wins over primaryApiKey
+            ("ai_oauth", "primary_key", ("code", None)),
+            # Regression guard: no useful credentials anywhere
+            ("mcp_only", "no_key", (None, "No credentials found")),
+        ],
+    )
+    def test_detect_mode_with_claude_json(
+        self, monkeypatch, fake_homes, payload_key, home_key, expected
+    ):
+        """detect_mode falls back to ~/.claude.json only below the credentials file"""
+        _set_admin_key_env(monkeypatch, None)
+        with patch("claude_usage.monitor.Path.home", return_value=fake_homes[home_key]):
+            result = detect_mode(CREDENTIALS_PATH, _provider(payload_key))
+
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "payload_key,admin_key,expected",
+        [
+            # OAuth takes priority over the environment variable
+            ("oauth_only", ADMIN_KEY, "code"),
+            # OAuth takes priority over the admin key in the file
+            ("oauth+admin", None, "code"),
+            ("oauth_only", None, "code"),
+            ("admin_only", None, "console"),
+            ("empty", ADMIN_KEY, "console"),
+            # An explicit mode field overrides both OAuth and admin key
+            ("mode_console", None, "console"),
+            ("mode_code", None, "code"),
+        ],
+    )
+    def test_detect_mode(self, monkeypatch, monitor, payload_key, admin_key, expected):
+        """Mode follows the credentials priority order"""
+        _set_admin_key_env(monkeypatch, admin_key)
+        monitor._reinit(CREDENTIALS_PATH, _provider(payload_key))
+
+        assert monitor.detect_mode() == expected
+        assert monitor.error_message is None
+
+    def test_detect_mode_error_when_no_credentials(
+        self, monkeypatch, monitor, fake_homes
+    ):
         """Test that mode detection returns error when no credentials found"""
-        # Don't create credentials file and use empty fake home (no ~/.claude.json)
-        with patch.dict(os.environ, {}, clear=True):
-            with patch("claude_usage.monitor.Path.home", return_value=self.fake_home):
-                monitor = ClaudeUsageMonitor(credentials_path=self.credentials_path)
-                mode = monitor.detect_mode()
-
-                self.assertIsNone(mode)
-                self.assertIsNotNone(monitor.error_message)
-                self.assertIn("No credentials", monitor.error_message)
-
-    def test_mode_field_override_in_credentials_forces_console(self):
-        """
-        GIVEN credentials file has 'mode' field set to 'console'
-        AND has both OAuth and Admin API credentials
-        WHEN detect_mode is called
-        THEN it should return 'console' (respecting the override)
-        """
-        credentials_data = {
-            "mode": "console",
-            "claudeAiOauth": {
-                "accessToken": "test-token",
-                "refreshToken": "test-refresh",
-                "expiresAt": 9999999999000,
-            },
-            "anthropicConsole": {"adminApiKey": "sk-ant-admin-test-key"},
-        }
-        with open(self.credentials_path, "w") as f:
-            json.dump(credentials_data, f)
-
-        with patch.dict(os.environ, {}, clear=True):
-            monitor = ClaudeUsageMonitor(credentials_path=self.credentials_path)
-            mode = monitor.detect_mode()
-
-            self.assertEqual(mode, "console")
-
-    def test_mode_field_override_in_credentials_forces_code(self):
-        """
-        GIVEN credentials file has 'mode' field set to 'code'
-        AND has both OAuth and Admin API credentials
-        WHEN detect_mode is called
-        THEN it should return 'code' (respecting the override)
-        """
-        credentials_data = {
-            "mode": "code",
-            "claudeAiOauth": {
-                "accessToken": "test-token",
-                "refreshToken": "test-refresh",
-                "expiresAt": 9999999999000,
-            },
-            "anthropicConsole": {"adminApiKey": "sk-ant-admin-test-key"},
-        }
-        with open(self.credentials_path, "w") as f:
-            json.dump(credentials_data, f)
-
-        with patch.dict(os.environ, {}, clear=True):
-            monitor = ClaudeUsageMonitor(credentials_path=self.credentials_path)
+        # No credentials file and an empty fake home (no ~/.claude.json);
+        # no provider, so the default file read hits FileNotFoundError
+        _set_admin_key_env(monkeypatch, None)
+        with patch("claude_usage.monitor.Path.home", return_value=fake_homes["empty"]):
+            monitor._reinit(fake_homes["empty"] / "missing.json")
             mode = monitor.detect_mode()
 
-            self.assertEqual(mode, "code")
-
-
-if __name__ == "__main__":
-    unittest.main()
+        assert mode is None
+        assert monitor.error_message is not None
+        assert "No credentials" in monitor.error_message
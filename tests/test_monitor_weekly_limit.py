@@ -1,6 +1,8 @@
 """Tests for weekly_limit_enabled flag support in monitor integration"""
 
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 from claude_usage.code_mode.monitor import CodeMonitor
 
@@ -10,8 +12,12 @@ class TestMonitorWeeklyLimit(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures"""
-        # Mock the storage path
-        with patch("claude_usage.code_mode.monitor.Path"):
+        # Point the home directory at a temp dir so storage stays out of the tree
+        tmp_ctx = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_ctx.cleanup)
+        with patch(
+            "claude_usage.code_mode.monitor.Path.home", return_value=Path(tmp_ctx.name)
+        ):
             self.monitor = CodeMonitor()
 
     def test_monitor_extracts_weekly_limit_enabled_from_pacemaker_status(self):
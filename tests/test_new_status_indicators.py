@@ -7,7 +7,9 @@ to the bottom left "Pacing Status" section:
 - Rules: N (green if >0, yellow if 0)
 """
 
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock, patch, mock_open
 from io import StringIO
 from rich.console import Console
@@ -323,115 +325,50 @@ class TestNewStatusFieldsPaceMakerReader(unittest.TestCase):
                 status = reader.get_status()
             self.assertIsNotNone(status)
 
-    @patch("claude_usage.code_mode.pacemaker_integration.Path")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_get_status_reads_tdd_enabled_from_config(self, mock_file, mock_path):
-        """Test that tdd_enabled is correctly read from config.json"""
-        mock_pm_dir = MagicMock()
-        mock_config_path = MagicMock()
-        mock_config_path.exists.return_value = True
-        mock_db_path = MagicMock()
-        mock_db_path.exists.return_value = False
-
-        mock_subpath = MagicMock()
-        mock_subpath.exists.return_value = False
-        mock_pm_dir.__truediv__ = MagicMock(return_value=mock_subpath)
-
-        mock_path.home.return_value.__truediv__ = MagicMock(return_value=mock_pm_dir)
-        mock_path.home.return_value.joinpath.return_value = mock_pm_dir
-        mock_pm_dir.exists.return_value = True
-
-        # Test with tdd_enabled=True
-        mock_file.return_value.read.return_value = (
-            '{"enabled": true, "tdd_enabled": true}'
-        )
+    def _reader_with_config(self, config_json):
+        """Return a PaceMakerReader whose config_path is a real config.json"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        config_path = Path(tmp.name) / "config.json"
+        config_path.write_text(config_json)
 
         reader = PaceMakerReader()
-        reader.pm_dir = mock_pm_dir
-        reader.config_path = mock_config_path
-        reader.db_path = mock_db_path
+        reader.pm_dir = Path(tmp.name)
+        reader.config_path = config_path
+        return reader
+
+    def test_get_status_reads_tdd_enabled_from_config(self):
+        """Test that tdd_enabled is correctly read from config.json"""
+        reader = self._reader_with_config('{"tdd_enabled": true}')
 
         # Call _read_config() directly to test config parsing
-        with patch.object(reader.config_path, "exists", return_value=True):
-            with patch("builtins.open", mock_open(read_data='{"tdd_enabled": true}')):
-                config = reader._read_config()
-                self.assertTrue(config.get("tdd_enabled"))
+        config = reader._read_config()
+        self.assertTrue(config.get("tdd_enabled"))
 
-    @patch("claude_usage.code_mode.pacemaker_integration.Path")
-    def test_get_status_defaults_tdd_enabled_to_false(self, mock_path):
+    def test_get_status_defaults_tdd_enabled_to_false(self):
         """Test that tdd_enabled defaults to False when not in config"""
-        mock_pm_dir = MagicMock()
-        mock_config_path = MagicMock()
-        mock_config_path.exists.return_value = True
-
-        mock_subpath = MagicMock()
-        mock_subpath.exists.return_value = False
-        mock_pm_dir.__truediv__ = MagicMock(return_value=mock_subpath)
-
-        mock_path.home.return_value.__truediv__ = MagicMock(return_value=mock_pm_dir)
-        mock_path.home.return_value.joinpath.return_value = mock_pm_dir
-        mock_pm_dir.exists.return_value = True
+        reader = self._reader_with_config('{"enabled": true}')
 
-        with patch("builtins.open", mock_open(read_data='{"enabled": true}')):
-            reader = PaceMakerReader()
-            reader.pm_dir = mock_pm_dir
-            reader.config_path = mock_config_path
-
-            config = reader._read_config()
-            # get() should return False when key is missing
-            self.assertEqual(config.get("tdd_enabled", False), False)
+        config = reader._read_config()
+        # get() should return False when key is missing
+        self.assertEqual(config.get("tdd_enabled", False), False)
 
-    @patch("claude_usage.code_mode.pacemaker_integration.Path")
-    def test_get_status_reads_preferred_subagent_model_from_config(self, mock_path):
+    def test_get_status_reads_preferred_subagent_model_from_config(self):
         """Test that preferred_subagent_model is correctly read from config.json"""
-        mock_pm_dir = MagicMock()
-        mock_config_path = MagicMock()
-        mock_config_path.exists.return_value = True
-
-        mock_subpath = MagicMock()
-        mock_subpath.exists.return_value = False
-        mock_pm_dir.__truediv__ = MagicMock(return_value=mock_subpath)
-
-        mock_path.home.return_value.__truediv__ = MagicMock(return_value=mock_pm_dir)
-        mock_path.home.return_value.joinpath.return_value = mock_pm_dir
-        mock_pm_dir.exists.return_value = True
-
-        with patch(
-            "builtins.open",
-            mock_open(
-                read_data='{"enabled": true, "preferred_subagent_model": "opus"}'
-            ),
-        ):
-            reader = PaceMakerReader()
-            reader.pm_dir = mock_pm_dir
-            reader.config_path = mock_config_path
+        reader = self._reader_with_config(
+            '{"enabled": true, "preferred_subagent_model": "opus"}'
+        )
 
-            config = reader._read_config()
-            self.assertEqual(config.get("preferred_subagent_model"), "opus")
+        config = reader._read_config()
+        self.assertEqual(config.get("preferred_subagent_model"), "opus")
 
-    @patch("claude_usage.code_mode.pacemaker_integration.Path")
-    def test_get_status_defaults_preferred_subagent_model_to_auto(self, mock_path):
+    def test_get_status_defaults_preferred_subagent_model_to_auto(self):
         """Test that preferred_subagent_model defaults to 'auto' when not in config"""
-        mock_pm_dir = MagicMock()
-        mock_config_path = MagicMock()
-        mock_config_path.exists.return_value = True
-
-        mock_subpath = MagicMock()
-        mock_subpath.exists.return_value = False
-        mock_pm_dir.__truediv__ = MagicMock(return_value=mock_subpath)
-
-        mock_path.home.return_value.__truediv__ = MagicMock(return_value=mock_pm_dir)
-        mock_path.home.return_value.joinpath.return_value = mock_pm_dir
-        mock_pm_dir.exists.return_value = True
-
-        with patch("builtins.open", mock_open(read_data='{"enabled": true}')):
-            reader = PaceMakerReader()
-            reader.pm_dir = mock_pm_dir
-            reader.config_path = mock_config_path
+        reader = self._reader_with_config('{"enabled": true}')
 
-            config = reader._read_config()
-            # get() should return 'auto' when key is missing
-            self.assertEqual(config.get("preferred_subagent_model", "auto"), "auto")
+        config = reader._read_config()
+        # get() should return 'auto' when key is missing
+        self.assertEqual(config.get("preferred_subagent_model", "auto"), "auto")
 
 
 class TestNewStatusFieldsIntegration(unittest.TestCase):
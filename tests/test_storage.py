@@ -2,9 +2,8 @@
 
 import json
 import sqlite3
-import tempfile
-from datetime import datetime
-from pathlib import Path
+import time
+import uuid
 
 import pytest
 
@@ -12,18 +11,54 @@ from claude_usage.code_mode.storage import (
     CodeAnalytics as UsageAnalytics,
     CodeStorage as UsageStorage,
 )
+from claude_usage.console_mode.storage import ConsoleAnalytics, ConsoleStorage
+
+HALF_HOUR = 1800
+DAY = 24 * 3600
+EIGHT_DAYS = 8 * DAY  # beyond the 7-day HISTORY_RETENTION
+
+
+@pytest.fixture
+def now():
+    """Current epoch second, read once per test
+
+    Storage and analytics read the real clock, so this cannot be frozen for
+    the whole session; offsets are derived from this single reading instead.
+    """
+    return int(time.time())
+
+
+@pytest.fixture
+def temp_db():
+    """Shared-cache in-memory database URI, kept alive for the whole test"""
+    uri = f"file:test_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    keeper = sqlite3.connect(uri, uri=True)
+    yield uri
+    keeper.close()
+
+
+def _seed_console_snapshots(db_path, rows):
+    """Insert (timestamp, mtd_cost, workspace_costs_json) rows in one transaction"""
+    conn = sqlite3.connect(db_path, uri=True)
+    try:
+        # Test data is disposable; skip the fsync on commit
+        conn.execute("PRAGMA synchronous=OFF")
+        with conn:
+            conn.executemany(
+                """
+                INSERT INTO console_usage_snapshots
+                (timestamp, mtd_cost, workspace_costs_json)
+                VALUES (?, ?, ?)
+            """,
+                rows,
+            )
+    finally:
+        conn.close()
 
 
 class TestUsageStorage:
     """Test suite for UsageStorage class"""
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            yield db_path
-
     @pytest.fixture
     def storage(self, temp_db):
         """Create UsageStorage instance"""
@@ -36,7 +71,7 @@ class TestUsageStorage:
         UsageStorage(temp_db)
 
         # Verify table exists
-        conn = sqlite3.connect(temp_db)
+        conn = sqlite3.connect(temp_db, uri=True)
         cursor = conn.cursor()
         cursor.execute(
             """
@@ -54,7 +89,7 @@ class TestUsageStorage:
         """Test console_usage_snapshots table has correct schema"""
         UsageStorage(temp_db)
 
-        conn = sqlite3.connect(temp_db)
+        conn = sqlite3.connect(temp_db, uri=True)
         cursor = conn.cursor()
         cursor.execute("PRAGMA table_info(console_usage_snapshots)")
         columns = {row[1]: row[2] for row in cursor.fetchall()}
@@ -80,7 +115,7 @@ class TestUsageStorage:
         assert result is True
 
         # Verify data in database
-        conn = sqlite3.connect(temp_db)
+        conn = sqlite3.connect(temp_db, uri=True)
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM console_usage_snapshots")
         row = cursor.fetchone()
@@ -105,7 +140,7 @@ class TestUsageStorage:
         assert result is True
 
         # Verify data stored with null workspace_costs_json
-        conn = sqlite3.connect(temp_db)
+        conn = sqlite3.connect(temp_db, uri=True)
         cursor = conn.cursor()
         cursor.execute("SELECT workspace_costs_json FROM console_usage_snapshots")
         row = cursor.fetchone()
@@ -114,29 +149,18 @@ class TestUsageStorage:
         assert row is not None
         assert row[0] == "null"
 
-    def test_store_console_snapshot_cleans_old_data(self, storage, temp_db):
+    def test_store_console_snapshot_cleans_old_data(self, storage, temp_db, now):
         """Test store_console_snapshot keeps only last 7 days of data"""
         # Insert old snapshot (8 days ago - beyond 7-day retention)
-        old_timestamp = int(datetime.now().timestamp()) - (8 * 24 * 3600)
-        conn = sqlite3.connect(temp_db)
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO console_usage_snapshots
-            (timestamp, mtd_cost, workspace_costs_json)
-            VALUES (?, ?, ?)
-        """,
-            (old_timestamp, 1.0, "[]"),
-        )
-        conn.commit()
-        conn.close()
+        old_timestamp = now - EIGHT_DAYS
+        _seed_console_snapshots(temp_db, [(old_timestamp, 1.0, "[]")])
 
         # Store new snapshot
         mtd_data = {"total_cost_usd": 5.0}
         storage.store_console_snapshot(mtd_data, [])
 
         # Verify old snapshot was deleted
-        conn = sqlite3.connect(temp_db)
+        conn = sqlite3.connect(temp_db, uri=True)
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM console_usage_snapshots")
         count = cursor.fetchone()[0]
@@ -144,6 +168,42 @@ class TestUsageStorage:
 
         assert count == 1  # Only new snapshot remains
 
+    def test_store_console_snapshot_retention_boundary(self, storage, temp_db, now):
+        """Test retention keeps snapshots just inside 7 days and drops older ones"""
+        ages = [6 * DAY, 7 * DAY - 60, 7 * DAY + 60, EIGHT_DAYS]
+        # Seed every age in one executemany transaction
+        _seed_console_snapshots(temp_db, [(now - age, 1.0, "[]") for age in ages])
+
+        storage.store_console_snapshot({"total_cost_usd": 5.0}, [])
+
+        conn = sqlite3.connect(temp_db, uri=True)
+        remaining = {
+            row[0]
+            for row in conn.execute(
+                "SELECT timestamp FROM console_usage_snapshots WHERE mtd_cost = 1.0"
+            )
+        }
+        conn.close()
+
+        assert remaining == {now - 6 * DAY, now - (7 * DAY - 60)}
+
+    @pytest.mark.parametrize("table", ["usage_snapshots", "console_usage_snapshots"])
+    def test_retention_delete_is_range_search(self, storage, temp_db, table):
+        """Test retention cleanup is an indexed range search, not a full scan
+
+        timestamp is an INTEGER PRIMARY KEY (rowid alias) on both tables, so
+        DELETE ... WHERE timestamp < ? never needs a table scan.
+        """
+        conn = sqlite3.connect(temp_db, uri=True)
+        plan = conn.execute(
+            f"EXPLAIN QUERY PLAN DELETE FROM {table} WHERE timestamp < ?", (0,)
+        ).fetchall()
+        conn.close()
+
+        details = " ".join(row[-1] for row in plan)
+        assert details.startswith("SEARCH")
+        assert "SCAN" not in details
+
     def test_store_console_snapshot_handles_missing_data(self, storage):
         """Test store_console_snapshot returns False for invalid data"""
         # None mtd_data
@@ -154,13 +214,6 @@ class TestUsageStorage:
 class TestUsageAnalytics:
     """Test suite for UsageAnalytics class"""
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            yield db_path
-
     @pytest.fixture
     def storage(self, temp_db):
         """Create UsageStorage instance"""
@@ -174,55 +227,35 @@ class TestUsageAnalytics:
     # ===== AC4: Console MTD Rate Calculation =====
 
     def test_calculate_console_mtd_rate_with_sufficient_data(
-        self, storage, analytics, temp_db
+        self, storage, analytics, temp_db, now
     ):
         """Test calculate_console_mtd_rate with 30-minute history"""
-        current_time = int(datetime.now().timestamp())
+        # A minute inside the 30-minute window, so a clock tick before the
+        # rate query cannot push the snapshot out of it
+        old_timestamp = now - HALF_HOUR + 60
+        _seed_console_snapshots(temp_db, [(old_timestamp, 10.0, "[]")])
 
-        # Insert snapshot 30 minutes ago
-        old_timestamp = current_time - 1800
-        conn = sqlite3.connect(temp_db)
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO console_usage_snapshots
-            (timestamp, mtd_cost, workspace_costs_json)
-            VALUES (?, ?, ?)
-        """,
-            (old_timestamp, 10.0, "[]"),
-        )
-        conn.commit()
-        conn.close()
-
-        # Calculate rate with current cost of $15 (increase of $5 over 30 min)
+        # Calculate rate with current cost of $15 (increase of $5 over 29 min)
         rate = analytics.calculate_console_mtd_rate(15.0)
 
         assert rate is not None
-        # $5 increase over 0.5 hours = $10/hour
-        assert abs(rate - 10.0) < 0.01
+        # $5 increase over 29 minutes = ~$10.34/hour
+        assert abs(rate - 5.0 * 3600 / (HALF_HOUR - 60)) < 0.01
 
     def test_calculate_console_mtd_rate_insufficient_data(self, analytics):
         """Test calculate_console_mtd_rate returns None without historical data"""
         rate = analytics.calculate_console_mtd_rate(10.0)
         assert rate is None
 
-    def test_calculate_console_mtd_rate_no_increase(self, storage, analytics, temp_db):
+    def test_calculate_console_mtd_rate_no_increase(
+        self, storage, analytics, temp_db, now
+    ):
         """Test calculate_console_mtd_rate handles zero or negative increase"""
-        current_time = int(datetime.now().timestamp())
-        old_timestamp = current_time - 1800
+        # A minute inside the 30-minute window, so a clock tick before the
+        # rate query cannot push the snapshot out of it
+        old_timestamp = now - HALF_HOUR + 60
 
-        conn = sqlite3.connect(temp_db)
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO console_usage_snapshots
-            (timestamp, mtd_cost, workspace_costs_json)
-            VALUES (?, ?, ?)
-        """,
-            (old_timestamp, 10.0, "[]"),
-        )
-        conn.commit()
-        conn.close()
+        _seed_console_snapshots(temp_db, [(old_timestamp, 10.0, "[]")])
 
         # Current cost same as old cost
         rate = analytics.calculate_console_mtd_rate(10.0)
@@ -290,3 +323,36 @@ class TestUsageAnalytics:
         # None hours
         result = analytics.project_console_eom_cost(10.0, 2.0, None)
         assert result is None
+
+
+class TestConsoleStorage:
+    """Test suite for ConsoleStorage and ConsoleAnalytics"""
+
+    @pytest.fixture
+    def storage(self, temp_db):
+        """Create ConsoleStorage instance"""
+        return ConsoleStorage(temp_db)
+
+    def test_store_console_snapshot_inserts_and_cleans_in_one_call(
+        self, storage, temp_db, now
+    ):
+        """Test store_console_snapshot writes the row and prunes old history"""
+        _seed_console_snapshots(temp_db, [(now - EIGHT_DAYS, 1.0, "[]")])
+
+        assert storage.store_console_snapshot({"total_cost_usd": 5.0}, []) is True
+
+        conn = sqlite3.connect(temp_db, uri=True)
+        rows = conn.execute("SELECT mtd_cost FROM console_usage_snapshots").fetchall()
+        conn.close()
+
+        assert rows == [(5.0,)]
+
+    def test_calculate_console_mtd_rate_reads_history(self, storage, temp_db, now):
+        """Test calculate_console_mtd_rate uses stored snapshots"""
+        _seed_console_snapshots(temp_db, [(now - HALF_HOUR, 10.0, "[]")])
+
+        rate = ConsoleAnalytics(storage).calculate_console_mtd_rate(15.0)
+
+        assert rate is not None
+        # $5 increase over ~0.5 hours = ~$10/hour
+        assert abs(rate - 10.0) < 0.1
@@ -10,14 +10,21 @@ Provides fixture-builder functions used by:
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from io import StringIO
 
+from rich.console import Console
+
+
+@lru_cache(maxsize=None)
+def _capture_console(width: int) -> Console:
+    """One Console per width; capture() keeps each render's output separate."""
+    return Console(file=StringIO(), width=width, force_terminal=True)
+
 
 def _render_to_str(renderable, width: int = 120) -> str:
     """Render any Rich renderable to a plain string via Console capture."""
-    from rich.console import Console
-
-    console = Console(file=StringIO(), width=width, force_terminal=True)
+    console = _capture_console(width)
     with console.capture() as capture:
         console.print(renderable)
     return capture.get()